@@ -20,12 +20,18 @@ def main():
     app.setApplicationVersion("1.0.0")
     
     # Import after QApplication is created
+    from rtb2000_control.core.logging_utils import setup_queue_logging
     from rtb2000_control.gui.main_window import MainWindow
     
+    # Log output is written by a listener thread, never by the GUI thread
+    log_listener = setup_queue_logging()
+    
     window = MainWindow()
     window.show()
     
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    log_listener.stop()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
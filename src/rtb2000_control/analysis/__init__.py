@@ -9,10 +9,24 @@ This module provides advanced data analysis capabilities for oscilloscope data:
 - Data export and visualization
 """
 
-from .fft_analysis import FFTAnalyzer
-from .statistics import StatisticalAnalyzer
-from .measurements import MeasurementEngine
-from .data_export import DataExporter
+import importlib
+
+# Analyzers are imported on first access so that loading one submodule
+# does not pull in SciPy/pandas for all of them
+_LAZY_EXPORTS = {
+    'FFTAnalyzer': '.fft_analysis',
+    'StatisticalAnalyzer': '.statistics',
+    'MeasurementEngine': '.measurements',
+    'DataExporter': '.data_export'
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'FFTAnalyzer',
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+RTB2000 Display Downsampling
+============================
+
+M4 decimation for waveform display: each bin of ds samples is reduced to
+its first sample, its minimum and maximum in time order, and its last
+sample. This preserves the signal envelope, and the lines joining adjacent
+bins, at a constant cost per screen pixel.
+"""
+
+import numpy as np
+from typing import Tuple
+
+from ._kernels import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
+
+    @njit(cache=True, parallel=True)
+    def m4_downsample(x: np.ndarray, y: np.ndarray, ds: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Reduce every ds samples to its first, min, max and last samples in time order"""
+        # The last bin holds the y.size % ds remainder, if any
+        n = (y.size + ds - 1) // ds
+        x_out = np.empty(4 * n, dtype=x.dtype)
+        y_out = np.empty(4 * n, dtype=y.dtype)
+        for i in prange(n):
+            start = i * ds
+            stop = min(start + ds, y.size)
+            imin = start
+            imax = start
+            for j in range(start + 1, stop):
+                v = y[j]
+                if v < y[imin]:
+                    imin = j
+                elif v > y[imax]:
+                    imax = j
+            lo = min(imin, imax)
+            hi = max(imin, imax)
+            last = stop - 1
+            k = 4 * i
+            x_out[k] = x[start]
+            y_out[k] = y[start]
+            x_out[k + 1] = x[lo]
+            y_out[k + 1] = y[lo]
+            x_out[k + 2] = x[hi]
+            y_out[k + 2] = y[hi]
+            x_out[k + 3] = x[last]
+            y_out[k + 3] = y[last]
+        return x_out, y_out
+
+else:
+
+    def m4_downsample(x: np.ndarray, y: np.ndarray, ds: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Reduce every ds samples to its first, min, max and last samples in time order"""
+        n = y.size // ds
+        bins = y[:n * ds].reshape(n, ds)
+        imin = bins.argmin(axis=1)
+        imax = bins.argmax(axis=1)
+        
+        # Per-bin offsets of (first, earlier extremum, later extremum, last)
+        offsets = np.empty((n, 4), dtype=np.intp)
+        offsets[:, 0] = 0
+        offsets[:, 1] = np.minimum(imin, imax)
+        offsets[:, 2] = np.maximum(imin, imax)
+        offsets[:, 3] = ds - 1
+        idx = (offsets + np.arange(0, n * ds, ds)[:, None]).ravel()
+        
+        # Partial last bin for the y.size % ds remainder
+        start = n * ds
+        if start < y.size:
+            tail = y[start:]
+            imin = int(tail.argmin())
+            imax = int(tail.argmax())
+            tail_idx = start + np.array([0, min(imin, imax), max(imin, imax), tail.size - 1])
+            idx = np.concatenate((idx, tail_idx))
+        return x[idx], y[idx]
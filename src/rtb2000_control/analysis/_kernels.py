@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+RTB2000 Numerical Kernels
+=========================
+
+Single-pass numerical kernels shared by the analysis modules.
+Compiled with Numba when available, otherwise implemented with NumPy.
+"""
+
+import numpy as np
+from typing import Tuple
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def fused_basic_stats(v: np.ndarray) -> Tuple[float, float, float, float]:
+        """Compute (mean, rms, min, max) in a single pass over v"""
+        n = v.size
+        total = 0.0
+        total_sq = 0.0
+        vmin = v[0]
+        vmax = v[0]
+        for i in range(n):
+            x = v[i]
+            total += x
+            total_sq += x * x
+            if x < vmin:
+                vmin = x
+            elif x > vmax:
+                vmax = x
+        return total / n, np.sqrt(total_sq / n), vmin, vmax
+        
+    @njit(cache=True)
+    def histogram_counts(v: np.ndarray, lo: float, hi: float, nbins: int) -> np.ndarray:
+        """Count v into nbins equal-width bins over [lo, hi]"""
+        counts = np.zeros(nbins, dtype=np.int64)
+        scale = nbins / (hi - lo)
+        for i in range(v.size):
+            x = v[i]
+            if x < lo or x > hi:
+                continue
+            idx = int((x - lo) * scale)
+            if idx >= nbins:
+                idx = nbins - 1  # Right edge belongs to the last bin
+            counts[idx] += 1
+        return counts
+        
+    @njit(cache=True, parallel=True, fastmath=True)
+    def affine_scale(raw: np.ndarray, gain: float, offset: float, out: np.ndarray):
+        """Write raw * gain + offset into out"""
+        for i in prange(raw.size):
+            out[i] = raw[i] * gain + offset
+            
+    @njit(cache=True, parallel=True, fastmath=True)
+    def affine_ramp(gain: float, offset: float, out: np.ndarray):
+        """Write i * gain + offset into out[i]"""
+        for i in prange(out.size):
+            out[i] = i * gain + offset
+
+else:
+
+    def fused_basic_stats(v: np.ndarray) -> Tuple[float, float, float, float]:
+        """Compute (mean, rms, min, max) of v"""
+        # np.dot sums the squares without a full-size v * v temporary
+        n = v.size
+        total = v.sum(dtype=np.float64)
+        total_sq = float(np.dot(v, v))
+        return (float(total / n), float(np.sqrt(total_sq / n)),
+                float(v.min()), float(v.max()))
+                
+    def histogram_counts(v: np.ndarray, lo: float, hi: float, nbins: int) -> np.ndarray:
+        """Count v into nbins equal-width bins over [lo, hi]"""
+        counts, _ = np.histogram(v, bins=nbins, range=(lo, hi))
+        return counts
+        
+    def affine_scale(raw: np.ndarray, gain: float, offset: float, out: np.ndarray):
+        """Write raw * gain + offset into out"""
+        np.multiply(raw, gain, out=out)
+        out += offset
+        
+    # Sample index reused by affine_ramp, grown on demand
+    _ramp_index = np.empty(0)
+    
+    def affine_ramp(gain: float, offset: float, out: np.ndarray):
+        """Write i * gain + offset into out[i]"""
+        global _ramp_index
+        n = out.size
+        # Work on a local reference: another thread may rebind the global
+        index = _ramp_index
+        if index.size < n:
+            index = np.arange(n, dtype=np.float64)
+            _ramp_index = index
+        np.multiply(index[:n], gain, out=out)
+        out += offset
@@ -17,6 +17,8 @@ import pyqtgraph as pg
 from typing import Dict, List, Tuple, Optional, Any
 import logging
 
+from ._kernels import fused_basic_stats, histogram_counts
+
 
 class StatisticalAnalyzer(QObject):
     """Advanced statistical analyzer for oscilloscope data"""
@@ -55,23 +57,27 @@ class StatisticalAnalyzer(QObject):
                 raise ValueError("Empty data array")
             
             # Remove any NaN or infinite values
-            clean_data = data[np.isfinite(data)]
+            finite = np.isfinite(data)
+            clean_data = data if finite.all() else data[finite]
             
             if len(clean_data) == 0:
                 raise ValueError("No valid data points")
             
+            # Mean, RMS and extrema in one pass
+            mean, rms, vmin, vmax = fused_basic_stats(clean_data)
+            
             # Basic statistics
             statistics = {
                 'count': len(clean_data),
-                'mean': float(np.mean(clean_data)),
+                'mean': float(mean),
                 'std': float(np.std(clean_data)),
                 'var': float(np.var(clean_data)),
-                'min': float(np.min(clean_data)),
-                'max': float(np.max(clean_data)),
-                'range': float(np.ptp(clean_data)),
+                'min': float(vmin),
+                'max': float(vmax),
+                'range': float(vmax - vmin),
                 'median': float(np.median(clean_data)),
-                'rms': float(np.sqrt(np.mean(clean_data**2))),
-                'peak_to_peak': float(np.ptp(clean_data))
+                'rms': float(rms),
+                'peak_to_peak': float(vmax - vmin)
             }
             
             # Percentiles
@@ -134,13 +140,15 @@ class StatisticalAnalyzer(QObject):
         except Exception:
             return 0.0
     
-    def compute_histogram(self, data: np.ndarray, bins: int = None) -> Dict[str, Any]:
+    def compute_histogram(self, data: np.ndarray, bins: int = None,
+                          value_range: Tuple[float, float] = None) -> Dict[str, Any]:
         """
         Compute histogram of the data
         
         Args:
             data: Input data array
             bins: Number of histogram bins
+            value_range: (min, max) of the data if already known
             
         Returns:
             Dictionary containing histogram data
@@ -150,13 +158,23 @@ class StatisticalAnalyzer(QObject):
                 bins = self.histogram_bins
             
             # Remove any NaN or infinite values
-            clean_data = data[np.isfinite(data)]
+            finite = np.isfinite(data)
+            clean_data = data if finite.all() else data[finite]
             
             if len(clean_data) == 0:
                 raise ValueError("No valid data points")
             
+            # Reuse known extrema to avoid another pass over the data
+            if value_range is None:
+                _, _, lo, hi = fused_basic_stats(clean_data)
+            else:
+                lo, hi = value_range
+            if lo == hi:
+                lo, hi = lo - 0.5, hi + 0.5
+            
             # Compute histogram
-            counts, bin_edges = np.histogram(clean_data, bins=bins)
+            counts = histogram_counts(clean_data, lo, hi, bins)
+            bin_edges = np.linspace(lo, hi, bins + 1)
             bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
             bin_width = bin_edges[1] - bin_edges[0]
             
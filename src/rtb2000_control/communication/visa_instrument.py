@@ -4,6 +4,7 @@ VISA Communication Module for RTB2000 Oscilloscope
 
 import pyvisa
 import logging
+import threading
 from typing import Optional, Union, List
 
 
@@ -22,6 +23,9 @@ class VisaInstrument:
         self.resource_manager = None
         self.logger = logging.getLogger(__name__)
         
+        # Serializes I/O when the instrument is shared between threads
+        self.io_lock = threading.RLock()
+        
     def connect(self, resource_name: str = None) -> bool:
         """
         Connect to the instrument
@@ -79,7 +83,8 @@ class VisaInstrument:
             raise RuntimeError("Not connected to instrument")
         
         self.logger.debug(f"Sending: {command}")
-        self.instrument.write(command)
+        with self.io_lock:
+            self.instrument.write(command)
     
     def query(self, command: str) -> str:
         """
@@ -95,26 +100,30 @@ class VisaInstrument:
             raise RuntimeError("Not connected to instrument")
         
         self.logger.debug(f"Querying: {command}")
-        response = self.instrument.query(command).strip()
+        with self.io_lock:
+            response = self.instrument.query(command).strip()
         self.logger.debug(f"Response: {response}")
         return response
     
-    def query_binary_values(self, command: str, datatype='f') -> List[float]:
+    def query_binary_values(self, command: str, datatype='f', container=list):
         """
         Query binary data from instrument
         
         Args:
             command: SCPI command string
             datatype: Data type for binary conversion
+            container: Result type; np.ndarray decodes the block without a list
             
         Returns:
-            List[float]: Binary data as list
+            Binary data as list, or in the requested container
         """
         if not self.instrument:
             raise RuntimeError("Not connected to instrument")
         
         self.logger.debug(f"Querying binary: {command}")
-        return self.instrument.query_binary_values(command, datatype=datatype)
+        with self.io_lock:
+            return self.instrument.query_binary_values(command, datatype=datatype,
+                                                       container=container)
     
     @staticmethod
     def list_resources() -> List[str]:
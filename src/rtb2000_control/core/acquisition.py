@@ -0,0 +1,158 @@
+"""
+Background Acquisition System for RTB2000
+Runs instrument I/O on a worker thread so VISA latency never blocks painting
+"""
+
+import time
+import logging
+from typing import Dict, List, Optional, Tuple
+from PyQt6.QtCore import QObject, QThread, QMutex, pyqtSignal
+
+from .logging_utils import RateLimitedLogger
+
+
+logger = logging.getLogger(__name__)
+rate_limited_logger = RateLimitedLogger(logger)
+
+# Consecutive failed cycles after which the link is treated as dead
+MAX_CONSECUTIVE_ERRORS = 20
+
+
+class AcquisitionWorker(QObject):
+    """
+    Producer that polls the oscilloscope and keeps only the latest frame
+    
+    Frames that the display has not consumed are overwritten, never queued:
+    when rendering falls behind, frames are skipped but no acquisition stalls.
+    """
+    
+    # Emitted when a frame is published into an empty slot; frames that
+    # replace an unread one do not emit again
+    frame_ready = pyqtSignal()
+    
+    # Emitted once when the loop gives up after repeated acquisition errors
+    acquisition_failed = pyqtSignal()
+    
+    def __init__(self, oscilloscope, interval_ms: int = 100):
+        """
+        Initialize acquisition worker
+        
+        Args:
+            oscilloscope: Connected RTB2000 instance
+            interval_ms: Target acquisition period in milliseconds
+        """
+        super().__init__()
+        
+        self.oscilloscope = oscilloscope
+        self.interval_ms = interval_ms
+        
+        # Single-slot buffer shared with the GUI thread
+        self._mutex = QMutex()
+        self._latest_frame = None
+        self._channels: List[int] = []
+        
+        # Triple-buffered waveform storage {channel: (time, voltage)}: one
+        # slot being written, one published, one held by the display
+        self._buffers = [{}, {}, {}]
+        self._write_slot = 0
+        self._latest_slot = None
+        self._held_slot = None
+        
+        self._running = False
+        self._paused = False
+        self._error_count = 0
+        
+    def set_channels(self, channels: List[int]):
+        """Set channels to acquire on the next cycle"""
+        self._mutex.lock()
+        try:
+            self._channels = list(channels)
+        finally:
+            self._mutex.unlock()
+            
+    def run(self):
+        """Acquisition loop, executed in the worker thread"""
+        self._running = True
+        
+        while self._running:
+            start_time = time.perf_counter()
+            if not self._paused:
+                self.acquire_data()
+            
+            elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+            QThread.msleep(max(0, self.interval_ms - elapsed_ms))
+            
+    def stop(self):
+        """Request the acquisition loop to exit"""
+        self._running = False
+        
+    def set_paused(self, paused: bool):
+        """Suspend or resume instrument polling without leaving the loop"""
+        self._paused = paused
+        
+    def acquire_data(self):
+        """Acquire waveforms and measurements for the selected channels"""
+        self._mutex.lock()
+        try:
+            channels = list(self._channels)
+        finally:
+            self._mutex.unlock()
+            
+        buffers = self._buffers[self._write_slot]
+        
+        try:
+            # Waveforms and measurements in one instrument transaction
+            waveform_data, measurements = self.oscilloscope.acquire_frame(channels, buffers)
+            
+            # Keep the (possibly regrown) underlying arrays for reuse
+            for channel, (time_data, voltage_data) in waveform_data.items():
+                buffers[channel] = (time_data.base, voltage_data.base)
+                
+        except Exception:
+            # Transient I/O errors during live acquisition - skip this frame
+            rate_limited_logger.exception("acquire_data", "Acquisition failed")
+            self._error_count += 1
+            if self._error_count >= MAX_CONSECUTIVE_ERRORS:
+                # Stop polling a dead link instead of retrying every cycle
+                logger.error("Stopping acquisition after %d consecutive errors",
+                             self._error_count)
+                self._running = False
+                self.acquisition_failed.emit()
+            return
+            
+        self._error_count = 0
+        
+        # Overwrite any unread frame: the display may fall behind, never queue
+        self._mutex.lock()
+        try:
+            notify = self._latest_frame is None
+            self._latest_frame = (waveform_data, measurements)
+            self._latest_slot = self._write_slot
+            self._write_slot = ({0, 1, 2} - {self._latest_slot, self._held_slot}).pop()
+        finally:
+            self._mutex.unlock()
+            
+        if notify:
+            self.frame_ready.emit()
+            
+    def take_latest(self) -> Optional[Tuple[Dict, Dict]]:
+        """
+        Take the most recent frame
+        
+        The frame's arrays stay valid until the next frame is taken.
+        
+        Returns:
+            (waveform_data, measurements) or None if no new frame is available.
+            measurements has one row per waveform_data channel, in key order.
+        """
+        self._mutex.lock()
+        try:
+            frame = self._latest_frame
+            self._latest_frame = None
+            if frame is not None:
+                self._held_slot = self._latest_slot
+                self._latest_slot = None
+        finally:
+            self._mutex.unlock()
+            
+        return frame
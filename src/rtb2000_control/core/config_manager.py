@@ -5,10 +5,14 @@ Version 2.0 - September 8, 2025
 Handles saving, loading, and managing instrument configurations
 """
 
+import copy
+import gzip
+import hashlib
 import json
 import os
+import tempfile
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
@@ -55,6 +59,7 @@ class DisplayConfig:
     max_points: int = 10000
     update_rate: int = 30
     theme: str = "dark"  # dark, light
+    perf_poll_ms: int = 1000  # performance dialog refresh interval
     
 
 @dataclass
@@ -143,6 +148,13 @@ class ConfigurationManager:
         # Current configuration
         self.current_config = RTB2000Configuration()
         
+        # Parsed JSON per file path, valid while (mtime_ns, size) is unchanged
+        self._parse_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        
+        # Preset listing with the presets directory mtime_ns it was built at;
+        # also dropped after presets are saved, deleted or imported
+        self._preset_cache: Optional[Tuple[Optional[int], List[Dict[str, Any]]]] = None
+        
         # Load last configuration
         self.load_current()
         
@@ -154,17 +166,66 @@ class ConfigurationManager:
             bool: Success status
         """
         try:
-            self.current_config.modified = datetime.now().isoformat()
+            payload = self.serialize_current()
+        except Exception as e:
+            print(f"Error saving current configuration: {e}")
+            return False
+            
+        return self.write_current(payload)
+        
+    def serialize_current(self) -> str:
+        """
+        Serialize current configuration for write_current
+        
+        Returns:
+            str: JSON text of the current configuration
+        """
+        self.current_config.modified = datetime.now().isoformat()
+        
+        config_dict = self._config_to_dict(self.current_config)
+        return json.dumps(config_dict, indent=2)
+        
+    def content_hash(self) -> bytes:
+        """
+        Hash the current configuration, ignoring its modification time
+        
+        Returns:
+            bytes: Digest that changes only when settings change
+        """
+        config_dict = self._config_to_dict(self.current_config)
+        config_dict.pop('modified', None)
+        
+        payload = json.dumps(config_dict, sort_keys=True).encode()
+        return hashlib.blake2b(payload, digest_size=16).digest()
+        
+    def write_current(self, payload: str) -> bool:
+        """
+        Write serialized configuration to the current configuration file
+        
+        Touches no configuration state, so it may run on a worker thread.
+        
+        Args:
+            payload: JSON text from serialize_current
             
-            config_dict = self._config_to_dict(self.current_config)
+        Returns:
+            bool: Success status
+        """
+        # Write a temporary file next to the target and swap it in, so an
+        # interrupted write never leaves a truncated configuration behind
+        target = self.current_config_file
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=target.name, suffix='.tmp')
+            with os.fdopen(fd, 'w', buffering=1 << 16) as f:
+                f.write(payload)
+            os.replace(tmp_path, target)
             
-            with open(self.current_config_file, 'w') as f:
-                json.dump(config_dict, f, indent=2)
-                
             return True
             
         except Exception as e:
             print(f"Error saving current configuration: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
             return False
             
     def load_current(self) -> bool:
@@ -176,8 +237,7 @@ class ConfigurationManager:
         """
         try:
             if self.current_config_file.exists():
-                with open(self.current_config_file, 'r') as f:
-                    config_dict = json.load(f)
+                config_dict = copy.deepcopy(self._read_json(self.current_config_file))
                     
                 self.current_config = self._dict_to_config(config_dict)
                 return True
@@ -222,6 +282,7 @@ class ConfigurationManager:
             with open(preset_file, 'w') as f:
                 json.dump(config_dict, f, indent=2)
                 
+            self._preset_cache = None
             return True
             
         except Exception as e:
@@ -244,8 +305,7 @@ class ConfigurationManager:
             if not preset_file.exists():
                 return False
                 
-            with open(preset_file, 'r') as f:
-                config_dict = json.load(f)
+            config_dict = copy.deepcopy(self._read_json(preset_file))
                 
             preset_config = self._dict_to_config(config_dict)
             
@@ -280,6 +340,7 @@ class ConfigurationManager:
             
             if preset_file.exists():
                 preset_file.unlink()
+                self._preset_cache = None
                 return True
             else:
                 return False
@@ -288,19 +349,31 @@ class ConfigurationManager:
             print(f"Error deleting preset '{name}': {e}")
             return False
             
-    def list_presets(self) -> List[Dict[str, Any]]:
+    def list_presets(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         List all available presets
         
+        Args:
+            refresh: Rebuild the listing even if the presets directory
+                    looks unchanged (e.g. a preset file edited in place)
+        
         Returns:
             List of preset information dictionaries
         """
+        # Files added, removed or renamed on disk change the directory mtime
+        try:
+            dir_mtime = self.presets_dir.stat().st_mtime_ns
+        except OSError:
+            dir_mtime = None
+            
+        if not refresh and self._preset_cache is not None and self._preset_cache[0] == dir_mtime:
+            return list(self._preset_cache[1])
+            
         presets = []
         
         try:
             for preset_file in self.presets_dir.glob("*.json"):
-                with open(preset_file, 'r') as f:
-                    config_dict = json.load(f)
+                config_dict = self._read_json(preset_file)
                     
                 preset_info = {
                     'name': config_dict.get('name', preset_file.stem),
@@ -314,8 +387,11 @@ class ConfigurationManager:
                 
         except Exception as e:
             print(f"Error listing presets: {e}")
+            return sorted(presets, key=lambda x: x['name'])
             
-        return sorted(presets, key=lambda x: x['name'])
+        presets.sort(key=lambda x: x['name'])
+        self._preset_cache = (dir_mtime, presets)
+        return list(presets)
         
     def export_configuration(self, filepath: str, include_presets: bool = False) -> bool:
         """
@@ -338,12 +414,15 @@ class ConfigurationManager:
             if include_presets:
                 export_data['presets'] = []
                 for preset_info in self.list_presets():
-                    with open(preset_info['file'], 'r') as f:
-                        preset_data = json.load(f)
+                    preset_data = self._read_json(Path(preset_info['file']))
                     export_data['presets'].append(preset_data)
                     
-            with open(filepath, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            # Compressed exports are written compact; plain JSON stays readable
+            with self._open_export_file(filepath, 'w') as f:
+                if str(filepath).endswith('.gz'):
+                    json.dump(export_data, f, separators=(',', ':'))
+                else:
+                    json.dump(export_data, f, indent=2)
                 
             return True
             
@@ -363,7 +442,7 @@ class ConfigurationManager:
             bool: Success status
         """
         try:
-            with open(filepath, 'r') as f:
+            with self._open_export_file(filepath, 'r') as f:
                 import_data = json.load(f)
                 
             # Import current configuration
@@ -379,6 +458,8 @@ class ConfigurationManager:
                     with open(preset_file, 'w') as f:
                         json.dump(preset_data, f, indent=2)
                         
+                self._preset_cache = None
+                
             return True
             
         except Exception as e:
@@ -414,6 +495,32 @@ class ConfigurationManager:
             if hasattr(self.current_config.display, key):
                 setattr(self.current_config.display, key, value)
                 
+    @staticmethod
+    def _open_export_file(filepath: str, mode: str):
+        """Open an export file as text, gzip-compressed if it ends in .gz"""
+        if str(filepath).endswith('.gz'):
+            return gzip.open(filepath, mode + 't', encoding='utf-8', compresslevel=6)
+        return open(filepath, mode, buffering=1 << 20)
+        
+    def _read_json(self, path: Path) -> Dict[str, Any]:
+        """
+        Read a JSON file, reusing the parsed result while the file is unchanged
+        
+        The returned dictionary is shared with the cache and must not be modified.
+        """
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        
+        cached = self._parse_cache.get(str(path))
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+            
+        with open(path, 'r') as f:
+            data = json.load(f)
+            
+        self._parse_cache[str(path)] = (stamp, data)
+        return data
+        
     def _config_to_dict(self, config: RTB2000Configuration) -> Dict[str, Any]:
         """Convert configuration to dictionary"""
         config_dict = asdict(config)
@@ -0,0 +1,69 @@
+"""
+Logging Utilities for RTB2000
+Rate-limited logging for error paths that can fire on every update tick
+"""
+
+import logging
+import logging.handlers
+import queue
+import time
+from typing import Dict
+
+
+class RateLimitedLogger:
+    """Logger wrapper that drops repeats from the same call site within an interval"""
+    
+    def __init__(self, logger: logging.Logger, interval: float = 1.0):
+        """
+        Initialize rate-limited logger
+        
+        Args:
+            logger: Logger that receives the emitted records
+            interval: Minimum seconds between records for one call site
+        """
+        self.logger = logger
+        self.interval = interval
+        self._last_emit: Dict[str, float] = {}
+        
+    def _should_emit(self, key: str) -> bool:
+        """Check and record whether a call site may log now"""
+        now = time.monotonic()
+        last = self._last_emit.get(key)
+        if last is not None and now - last < self.interval:
+            return False
+        self._last_emit[key] = now
+        return True
+        
+    def exception(self, key: str, message: str, *args):
+        """Log the current exception with traceback, rate-limited by key"""
+        if self._should_emit(key):
+            self.logger.exception(message, *args)
+            
+    def warning(self, key: str, message: str, *args):
+        """Log a warning, rate-limited by key"""
+        if self._should_emit(key):
+            self.logger.warning(message, *args)
+
+
+def setup_queue_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Route root logging through a queue so callers never block on output
+    
+    Args:
+        level: Root logger level
+        
+    Returns:
+        Started listener; call stop() on shutdown to flush pending records
+    """
+    log_queue = queue.SimpleQueue()
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
@@ -5,7 +5,9 @@ Channel Control Widget
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QCheckBox, QDoubleSpinBox, QComboBox, QGroupBox,
                              QGridLayout)
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import pyqtSignal, QSignalBlocker
+
+from .settings_throttle import SettingsThrottle
 
 
 class ChannelControlWidget(QWidget):
@@ -17,6 +19,9 @@ class ChannelControlWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.channels = {}
+        
+        self._throttle = SettingsThrottle(self.settings_changed.emit, self)
+        
         self.init_ui()
         
     def init_ui(self):
@@ -84,23 +89,31 @@ class ChannelControlWidget(QWidget):
         
     def on_setting_changed(self, channel: int, setting: str, value):
         """Handle setting change"""
-        self.settings_changed.emit(channel, {setting: value})
+        if setting in ('scale', 'position'):
+            self._throttle.queue({setting: value}, key=channel)
+        else:
+            self.settings_changed.emit(channel, {setting: value})
         
     def update_channel_info(self, channel: int, info: dict):
         """Update channel display with current info"""
         if channel in self.channels:
             controls = self.channels[channel]
             
+            # Values read from the instrument must not be echoed back to it
             if 'enabled' in info:
-                controls['enable'].setChecked(info['enabled'])
+                with QSignalBlocker(controls['enable']):
+                    controls['enable'].setChecked(info['enabled'])
             if 'scale' in info:
-                controls['scale'].setValue(info['scale'])
+                with QSignalBlocker(controls['scale']):
+                    controls['scale'].setValue(info['scale'])
             if 'position' in info:
-                controls['position'].setValue(info['position'])
+                with QSignalBlocker(controls['position']):
+                    controls['position'].setValue(info['position'])
             if 'coupling' in info:
                 index = controls['coupling'].findText(info['coupling'])
                 if index >= 0:
-                    controls['coupling'].setCurrentIndex(index)
+                    with QSignalBlocker(controls['coupling']):
+                        controls['coupling'].setCurrentIndex(index)
                     
     def is_channel_enabled(self, channel: int) -> bool:
         """Check if channel is enabled"""
@@ -144,13 +144,21 @@ class IconManager:
         </svg>"""
     }
     
-    @staticmethod
-    def get_icon(name, size=16):
+    # Rendered icons keyed by (name, size); icons are immutable once built
+    _icon_cache = {}
+    
+    @classmethod
+    def get_icon(cls, name, size=16):
         """Get QIcon from SVG data"""
-        if name not in IconManager.ICONS:
+        key = (name, size)
+        icon = cls._icon_cache.get(key)
+        if icon is not None:
+            return icon
+            
+        if name not in cls.ICONS:
             return QIcon()
             
-        svg_data = IconManager.ICONS[name]
+        svg_data = cls.ICONS[name]
         svg_bytes = QByteArray(svg_data.encode('utf-8'))
         
         pixmap = QPixmap()
@@ -161,7 +169,9 @@ class IconManager:
             scaled_pixmap = pixmap.scaled(size, size, 
                                         Qt.AspectRatioMode.KeepAspectRatio,
                                         Qt.TransformationMode.SmoothTransformation)
-            return QIcon(scaled_pixmap)
+            icon = QIcon(scaled_pixmap)
+            cls._icon_cache[key] = icon
+            return icon
         
         return QIcon()
     
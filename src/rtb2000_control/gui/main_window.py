@@ -3,11 +3,16 @@ Main Window for RTB2000 Oscilloscope Control GUI
 """
 
 import sys
-from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
+import logging
+import threading
+import numpy as np
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QTabWidget, QMenuBar, QStatusBar, QToolBar,
                              QMessageBox, QSplitter, QFileDialog, QComboBox,
-                             QPushButton, QLabel, QInputDialog)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve, QRect
+                             QPushButton, QLabel, QInputDialog, QDialog, QTextEdit,
+                             QGroupBox, QCheckBox)
+from PyQt6.QtCore import (Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer, QThread,
+                          QEvent, QRect)
 from PyQt6.QtGui import QIcon, QKeySequence, QCloseEvent, QAction
 
 from .connection_widget import ConnectionWidget
@@ -15,43 +20,166 @@ from .channel_control_widget import ChannelControlWidget
 from .timebase_widget import TimebaseWidget
 from .trigger_widget import TriggerWidget
 from .waveform_widget import WaveformWidget
-from .measurement_widget import MeasurementWidget
+from .measurement_widget import MeasurementWidget, MEASUREMENT_DTYPE
 from ..instruments.rtb2000 import RTB2000
 from ..core.config_manager import ConfigurationManager, RTB2000Configuration
 from ..core.performance import PerformanceOptimizer, PerformanceMetrics
+from ..core.acquisition import AcquisitionWorker
+from ..core.logging_utils import RateLimitedLogger
 from .themes import get_theme_stylesheet, apply_theme_to_application
 from .icons import IconManager
 
 
+logger = logging.getLogger(__name__)
+
+# Error paths on the update hot path log at most once per second per site
+rate_limited_logger = RateLimitedLogger(logger)
+
+
+STATUS_BAR_STYLE = """
+QStatusBar {
+    background-color: #2d2d30;
+    color: #cccccc;
+    border-top: 1px solid #3e3e42;
+    padding: 4px;
+}
+
+QLabel[perfState="good"] { color: #44ff44; }
+QLabel[perfState="fair"] { color: #ffaa00; }
+QLabel[perfState="poor"] { color: #ff4444; }
+"""
+
+# Skip per-file icon lookup and symlink resolution, which stall the
+# dialog on network and removable drives
+FILE_DIALOG_OPTIONS = (QFileDialog.Option.DontUseCustomDirectoryIcons |
+                       QFileDialog.Option.DontResolveSymlinks)
+
+PERF_TOOLTIP_FMT = ("Performance Metrics:\n"
+                    "CPU: {cpu:.1f}%\n"
+                    "Memory: {mem_pct:.1f}% ({mem_mb:.1f} MB)\n"
+                    "FPS: {fps:.1f}\n"
+                    "GPU Memory: {gpu:.1f} MB")
+
+SHORTCUTS_TEXT = """
+Keyboard Shortcuts:
+
+File Operations:
+Ctrl+S - Save Configuration
+Ctrl+O - Load Configuration
+Ctrl+E - Export Waveform Data
+Ctrl+Shift+S - Take Screenshot
+Ctrl+Shift+P - Save Current as Preset
+Ctrl+Q - Exit
+
+View Operations:
+Ctrl+A - Auto Scale
+Ctrl+G - Toggle Grid
+Ctrl+H - Toggle Crosshair
+Ctrl+L - Clear Display
+
+Acquisition:
+F5 - Run/Stop
+F6 - Single Trigger
+
+Configuration:
+• Auto-save every 30 seconds
+• Session restore on startup
+• Preset management via toolbar
+"""
+
+ABOUT_TEXT = ("RTB2000 Oscilloscope Control GUI\n\n"
+              "Version 2.0 Enhanced Edition\n"
+              "Built with PyQt6, PyVISA, and PyQtGraph\n\n"
+              "Features:\n"
+              "• High-performance real-time waveform display\n"
+              "• Interactive cursors and measurements\n"
+              "• Professional data export capabilities\n"
+              "• Advanced configuration management\n"
+              "• Keyboard shortcuts for productivity\n\n"
+              "© 2025 RTB2000 Project")
+
+
+def _run_bounded(target, timeout: float) -> bool:
+    """Run target on a daemon thread, returning False if it outlives timeout"""
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+    
+
+class _ConfigSaveSignals(QObject):
+    """Signals for _ConfigSaveTask; QRunnable cannot emit signals itself"""
+    
+    finished = pyqtSignal(bool)
+    
+    
+class _ConfigSaveTask(QRunnable):
+    """Write a serialized configuration on the global thread pool"""
+    
+    def __init__(self, config_manager: ConfigurationManager, payload: str):
+        super().__init__()
+        self.config_manager = config_manager
+        self.payload = payload
+        self.signals = _ConfigSaveSignals()
+        
+    def run(self):
+        """Write the payload, executed in a pool thread"""
+        self.signals.finished.emit(self.config_manager.write_current(self.payload))
+        
+        
 class MainWindow(QMainWindow):
     """Main application window"""
     
     # Signals
     instrument_connected = pyqtSignal(bool)
     
+    # Composed application stylesheets, keyed by theme name
+    _theme_cache: dict[str, str] = {}
+    
     def __init__(self):
         super().__init__()
         
         # Initialize configuration manager
         self.config_manager = ConfigurationManager()
         
+        # Auto-save writes only after a settings change, and only if the
+        # content differs from the last save
+        self._config_dirty = False
+        self._saved_config_hash = None
+        
         # Initialize performance optimizer
         self.performance_optimizer = PerformanceOptimizer()
         self.setup_performance_monitoring()
         
         # Initialize instrument
         self.oscilloscope = RTB2000()
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_data)
+        
+        # Acquisition runs on a worker thread; the GUI thread only renders
+        self.acquisition_thread = None
+        self.acquisition_worker = None
+        self._stalled_acquisition = []  # (thread, worker) pairs that outlived a stop timeout
+        self._enabled_channels: tuple[int, ...] = ()
+        
+        # Values last written to the instrument, so repeated settings skip VISA
+        self._last_sent = {'ch': {}, 'tb': {}, 'trg': {}}
+        
+        # Reused measurement records (row = channel - 1) and validity mask
+        self._meas_buf = np.zeros(4, dtype=MEASUREMENT_DTYPE)
+        self._meas_values = self._meas_buf.view(np.float64).reshape(4, -1)
+        self._meas_mask = np.zeros(4, dtype=bool)
+        self._meas_refresh_pending = False
+        
+        # Display-side measurements (Vpp/RMS) computed by the waveform widget;
+        # the measurement table is fed only from instrument frames
+        self._waveform_measurements: dict = {}
         
         # Theme management
         self.current_theme = "dark"
-        
-        # Animation setup
-        self.setup_animations()
+        self._applied_theme = None
         
         self.init_ui()
         self.connect_signals()
+        self.refresh_enabled_channels()
         
         # Apply professional styling
         self.apply_professional_styling()
@@ -65,12 +193,6 @@ class MainWindow(QMainWindow):
         # Start performance optimization
         self.performance_optimizer.start_optimization()
         
-    def setup_animations(self):
-        """Setup UI animations"""
-        self.status_animation = QPropertyAnimation(self, b"geometry")
-        self.status_animation.setDuration(300)
-        self.status_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        
     def setup_performance_monitoring(self):
         """Setup performance monitoring and optimization"""
         # Connect performance signals
@@ -83,6 +205,18 @@ class MainWindow(QMainWindow):
         self.last_performance_metrics = None
         self.performance_warnings_count = 0
         
+        # Performance and settings dialogs, created on first use
+        self._perf_dialog = None
+        self._settings_dialog = None
+        self._shortcuts_msgbox = None
+        
+        # Coalesce metric bursts into at most one status bar update per interval
+        self._pending_metrics = None
+        self._metrics_flush_timer = QTimer(self)
+        self._metrics_flush_timer.setSingleShot(True)
+        self._metrics_flush_timer.setInterval(250)
+        self._metrics_flush_timer.timeout.connect(self.flush_performance_metrics)
+        
     def init_ui(self):
         """Initialize user interface"""
         self.setWindowTitle("RTB2000 Oscilloscope Control - Professional Edition")
@@ -92,6 +226,9 @@ class MainWindow(QMainWindow):
         # Set application icon
         self.setWindowIcon(IconManager.get_icon("settings", 32))
         
+        # Icon actions by icon name, built once and reused across theme changes
+        self._actions: dict[str, QAction] = {}
+        
         # Create menu bar
         self.create_menu_bar()
         
@@ -124,7 +261,7 @@ class MainWindow(QMainWindow):
         splitter.setSizes([400, 800])
         
         # Status bar
-        self.statusBar().showMessage("Disconnected")
+        self.show_status_message("Disconnected")
         
     def create_menu_bar(self):
         """Create application menu bar"""
@@ -235,7 +372,7 @@ class MainWindow(QMainWindow):
         performance_menu.addAction(optimize_action)
         
         cleanup_action = QAction('Memory Cleanup', self)
-        cleanup_action.triggered.connect(lambda: self.performance_optimizer.memory_optimizer.force_cleanup())
+        cleanup_action.triggered.connect(self.performance_optimizer.memory_optimizer.optimize_memory)
         performance_menu.addAction(cleanup_action)
         
         performance_menu.addSeparator()
@@ -276,21 +413,21 @@ class MainWindow(QMainWindow):
         toolbar.addSeparator()
         
         # Acquisition actions with professional icons
-        self.run_action = QAction(IconManager.get_icon("run"), 'Run', self)
+        self.run_action = self.create_icon_action("run", 'Run')
         self.run_action.setShortcut(QKeySequence('F5'))
         self.run_action.triggered.connect(self.run_acquisition)
         self.run_action.setEnabled(False)
         self.run_action.setToolTip("Start continuous acquisition (F5)")
         toolbar.addAction(self.run_action)
         
-        self.stop_action = QAction(IconManager.get_icon("stop"), 'Stop', self)
+        self.stop_action = self.create_icon_action("stop", 'Stop')
         self.stop_action.setShortcut(QKeySequence('F5'))  # Same key toggles
         self.stop_action.triggered.connect(self.stop_acquisition)
         self.stop_action.setEnabled(False)
         self.stop_action.setToolTip("Stop acquisition (F5)")
         toolbar.addAction(self.stop_action)
         
-        self.single_action = QAction(IconManager.get_icon("single"), 'Single', self)
+        self.single_action = self.create_icon_action("single", 'Single')
         self.single_action.setShortcut(QKeySequence('F6'))
         self.single_action.triggered.connect(self.single_acquisition)
         self.single_action.setEnabled(False)
@@ -300,13 +437,13 @@ class MainWindow(QMainWindow):
         toolbar.addSeparator()
         
         # View actions with professional icons
-        auto_scale_toolbar_action = QAction(IconManager.get_icon("auto_scale"), 'Auto Scale', self)
+        auto_scale_toolbar_action = self.create_icon_action("auto_scale", 'Auto Scale')
         auto_scale_toolbar_action.triggered.connect(self.auto_scale_waveform)
         auto_scale_toolbar_action.setShortcut(QKeySequence('Ctrl+A'))
         auto_scale_toolbar_action.setToolTip("Auto scale all channels (Ctrl+A)")
         toolbar.addAction(auto_scale_toolbar_action)
         
-        clear_display_toolbar_action = QAction(IconManager.get_icon("clear"), 'Clear', self)
+        clear_display_toolbar_action = self.create_icon_action("clear", 'Clear')
         clear_display_toolbar_action.triggered.connect(self.clear_waveform_display)
         clear_display_toolbar_action.setShortcut(QKeySequence('Ctrl+L'))
         clear_display_toolbar_action.setToolTip("Clear waveform display (Ctrl+L)")
@@ -317,6 +454,18 @@ class MainWindow(QMainWindow):
         # Configuration management controls
         self.add_preset_controls(toolbar)
         
+    def create_icon_action(self, icon_name: str, text: str) -> QAction:
+        """Create an action with an icon and register it for theme refreshes"""
+        action = QAction(IconManager.get_icon(icon_name), text, self)
+        self._actions[icon_name] = action
+        return action
+        
+    def refresh_action_icons(self):
+        """Re-apply icons to the existing actions (cached icon lookups)"""
+        # connect_action is excluded: update_connection_status owns its icon
+        for icon_name, action in self._actions.items():
+            action.setIcon(IconManager.get_icon(icon_name))
+        
     def add_preset_controls(self, toolbar):
         """Add preset management controls to toolbar"""
         # Preset label with enhanced styling
@@ -330,25 +479,33 @@ class MainWindow(QMainWindow):
         self.preset_combo.setMinimumWidth(180)
         self.preset_combo.setMaximumWidth(250)
         self.preset_combo.setToolTip("Select preset configuration")
-        self.preset_combo.currentTextChanged.connect(self.load_selected_preset)
+        self.preset_combo.currentTextChanged.connect(self.on_preset_selection_changed)
         toolbar.addWidget(self.preset_combo)
         
+        # Only the final selection of a rapid sequence is loaded
+        self._pending_preset = None
+        self._preset_debounce = QTimer(self)
+        self._preset_debounce.setSingleShot(True)
+        self._preset_debounce.setInterval(150)
+        self._preset_debounce.timeout.connect(self._apply_pending_preset)
+        self._listed_preset_names = None
+        
         # Save preset button with icon
-        self.save_preset_action = QAction(IconManager.get_icon("save"), 'Save Preset', self)
+        self.save_preset_action = self.create_icon_action("save", 'Save Preset')
         self.save_preset_action.setShortcut(QKeySequence('Ctrl+Shift+P'))
         self.save_preset_action.triggered.connect(self.save_current_as_preset)
         self.save_preset_action.setToolTip("Save current configuration as preset (Ctrl+Shift+P)")
         toolbar.addAction(self.save_preset_action)
         
         # Delete preset button with icon
-        self.delete_preset_action = QAction(IconManager.get_icon("delete"), 'Delete', self)
+        self.delete_preset_action = self.create_icon_action("delete", 'Delete')
         self.delete_preset_action.triggered.connect(self.delete_current_preset)
         self.delete_preset_action.setToolTip("Delete selected preset")
         toolbar.addAction(self.delete_preset_action)
         
         # Refresh presets button with icon
-        self.refresh_presets_action = QAction(IconManager.get_icon("refresh"), 'Refresh', self)
-        self.refresh_presets_action.triggered.connect(self.refresh_preset_list)
+        self.refresh_presets_action = self.create_icon_action("refresh", 'Refresh')
+        self.refresh_presets_action.triggered.connect(lambda: self.refresh_preset_list(refresh=True))
         self.refresh_presets_action.setToolTip("Refresh preset list")
         toolbar.addAction(self.refresh_presets_action)
         
@@ -374,6 +531,7 @@ class MainWindow(QMainWindow):
         # Control tabs
         tab_widget = QTabWidget()
         parent.addWidget(tab_widget)
+        self.control_tabs = tab_widget
         
         # Channel control tab
         self.channel_widget = ChannelControlWidget()
@@ -394,50 +552,81 @@ class MainWindow(QMainWindow):
         # Analysis tab
         self.analysis_widget = self.create_analysis_widget()
         tab_widget.addTab(self.analysis_widget, "Analysis")
+        tab_widget.currentChanged.connect(self.on_control_tab_changed)
         
     def create_analysis_widget(self):
-        """Create comprehensive analysis widget"""
-        from PyQt6.QtWidgets import QTabWidget, QWidget, QVBoxLayout
-        
+        """Create analysis widget; each sub-tab is built on first activation"""
         analysis_tab_widget = QTabWidget()
         
-        try:
-            # FFT Analysis tab
-            from ..analysis.fft_analysis import FFTAnalyzer, FFTWidget
-            self.fft_analyzer = FFTAnalyzer()
-            fft_widget = FFTWidget(self.fft_analyzer)
-            analysis_tab_widget.addTab(fft_widget, "FFT")
-            
-            # Statistics tab
-            from ..analysis.statistics import StatisticalAnalyzer, StatisticsWidget
-            self.statistical_analyzer = StatisticalAnalyzer()
-            statistics_widget = StatisticsWidget(self.statistical_analyzer)
-            analysis_tab_widget.addTab(statistics_widget, "Statistics")
-            
-            # Measurements tab
-            from ..analysis.measurements import MeasurementEngine, MeasurementWidget
-            self.measurement_engine = MeasurementEngine()
-            measurement_analysis_widget = MeasurementWidget(self.measurement_engine)
-            analysis_tab_widget.addTab(measurement_analysis_widget, "Auto Measurements")
-            
-            # Data Export tab
-            from ..analysis.data_export import DataExporter, ExportWidget
-            self.data_exporter = DataExporter()
-            export_widget = ExportWidget(self.data_exporter)
-            analysis_tab_widget.addTab(export_widget, "Export")
-            
-            # Connect analysis systems to data updates
-            self.setup_analysis_connections()
+        # Placeholders keep tab order; heavy analysis modules load on demand
+        self._analysis_builders = [
+            ("FFT", self.build_fft_tab),
+            ("Statistics", self.build_statistics_tab),
+            ("Auto Measurements", self.build_measurements_tab),
+            ("Export", self.build_export_tab),
+        ]
+        self._analysis_built: set[int] = set()
+        for title, _ in self._analysis_builders:
+            analysis_tab_widget.addTab(QWidget(), title)
             
+        analysis_tab_widget.currentChanged.connect(self.build_analysis_tab)
+        
+        return analysis_tab_widget
+    
+    def on_control_tab_changed(self, index: int):
+        """Build the visible analysis sub-tab when the Analysis tab opens"""
+        if self.control_tabs.widget(index) is self.analysis_widget:
+            self.build_analysis_tab(self.analysis_widget.currentIndex())
+    
+    def build_analysis_tab(self, index: int):
+        """Replace an analysis placeholder tab with its real widget"""
+        if index < 0 or index in self._analysis_built:
+            return
+        self._analysis_built.add(index)
+        
+        title, builder = self._analysis_builders[index]
+        try:
+            widget = builder()
         except ImportError as e:
             # Fallback if analysis modules not available
-            fallback_widget = QWidget()
-            layout = QVBoxLayout(fallback_widget)
-            from PyQt6.QtWidgets import QLabel
+            widget = QWidget()
+            layout = QVBoxLayout(widget)
             layout.addWidget(QLabel(f"Analysis features not available: {e}"))
-            analysis_tab_widget.addTab(fallback_widget, "Analysis Unavailable")
-        
-        return analysis_tab_widget
+            
+        tabs = self.analysis_widget
+        tabs.blockSignals(True)
+        tabs.removeTab(index)
+        tabs.insertTab(index, widget, title)
+        tabs.setCurrentIndex(index)
+        tabs.blockSignals(False)
+        
+    def build_fft_tab(self):
+        """Create FFT analysis tab"""
+        from ..analysis.fft_analysis import FFTAnalyzer, FFTWidget
+        self.fft_analyzer = FFTAnalyzer()
+        return FFTWidget(self.fft_analyzer)
+        
+    def build_statistics_tab(self):
+        """Create statistics tab"""
+        from ..analysis.statistics import StatisticalAnalyzer, StatisticsWidget
+        self.statistical_analyzer = StatisticalAnalyzer()
+        return StatisticsWidget(self.statistical_analyzer)
+        
+    def build_measurements_tab(self):
+        """Create automatic measurements tab"""
+        from ..analysis.measurements import MeasurementEngine, MeasurementWidget
+        self.measurement_engine = MeasurementEngine()
+        widget = MeasurementWidget(self.measurement_engine)
+        
+        # Connect analysis systems to data updates
+        self.setup_analysis_connections()
+        return widget
+        
+    def build_export_tab(self):
+        """Create data export tab"""
+        from ..analysis.data_export import DataExporter, ExportWidget
+        self.data_exporter = DataExporter()
+        return ExportWidget(self.data_exporter)
     
     def setup_analysis_connections(self):
         """Setup connections for analysis systems"""
@@ -454,8 +643,8 @@ class MainWindow(QMainWindow):
                 default_measurements = ['DC Average', 'RMS', 'Peak-Peak', 'Frequency']
                 self.measurement_engine.set_auto_measurements(default_measurements)
                 
-        except Exception as e:
-            print(f"Error setting up analysis connections: {e}")
+        except Exception:
+            logger.exception("Error setting up analysis connections")
     
     def update_analysis_data(self, channel_data: dict):
         """Update analysis systems with new data"""
@@ -470,10 +659,11 @@ class MainWindow(QMainWindow):
                     if hasattr(self, 'fft_analyzer'):
                         self.fft_analyzer.compute_fft(voltage_data, sample_rate)
                     
-                    # Update statistical analyzer
+                    # Update statistical analyzer; histogram reuses the extrema
                     if hasattr(self, 'statistical_analyzer'):
-                        self.statistical_analyzer.compute_basic_statistics(voltage_data)
-                        self.statistical_analyzer.compute_histogram(voltage_data)
+                        stats = self.statistical_analyzer.compute_basic_statistics(voltage_data)
+                        value_range = (stats['min'], stats['max']) if stats else None
+                        self.statistical_analyzer.compute_histogram(voltage_data, value_range=value_range)
                     
                     # Update measurement engine
                     if hasattr(self, 'measurement_engine'):
@@ -485,8 +675,8 @@ class MainWindow(QMainWindow):
                             channel, time_data, voltage_data, sample_rate
                         )
                         
-        except Exception as e:
-            print(f"Error updating analysis data: {e}")
+        except Exception:
+            rate_limited_logger.exception("update_analysis_data", "Error updating analysis data")
         
     def connect_signals(self):
         """Connect signals between widgets"""
@@ -494,8 +684,10 @@ class MainWindow(QMainWindow):
         self.connection_widget.connect_requested.connect(self.connect_instrument)
         self.connection_widget.disconnect_requested.connect(self.disconnect_instrument)
         
-        # Instrument connection signal
-        self.instrument_connected.connect(self.on_connection_changed)
+        # Instrument connection signal; queued so the settings read-back runs
+        # on a later event-loop pass instead of inside the connect handler
+        self.instrument_connected.connect(self.on_connection_changed,
+                                          Qt.ConnectionType.QueuedConnection)
         
         # Control widget signals
         self.channel_widget.settings_changed.connect(self.update_channel_settings)
@@ -508,8 +700,7 @@ class MainWindow(QMainWindow):
         
     def on_waveform_measurements(self, measurements: dict):
         """Handle measurement updates from waveform widget"""
-        # Update measurement widget with new measurements
-        self.measurement_widget.update_measurements(measurements)
+        self._waveform_measurements = measurements
         
         # Update status bar with key measurements
         if measurements:
@@ -517,7 +708,13 @@ class MainWindow(QMainWindow):
             for ch, data in measurements.items():
                 if 'vpp' in data:
                     status_text += f"CH{ch}:{data['vpp']:.2f}Vpp "
-            self.statusBar().showMessage(status_text)
+                    
+            self.show_status_message(status_text)
+            
+    def show_status_message(self, message: str, timeout: int = 0):
+        """Show a status bar message, skipping the repaint if it is already shown"""
+        if message != self.statusBar().currentMessage():
+            self.statusBar().showMessage(message, timeout)
             
     def on_cursor_moved(self, x: float, y: float):
         """Handle cursor movement from waveform widget"""
@@ -531,7 +728,7 @@ class MainWindow(QMainWindow):
             if self.oscilloscope.connect(resource_name):
                 self.instrument_connected.emit(True)
                 self.start_data_updates()
-                self.statusBar().showMessage(f"Connected to {resource_name}")
+                self.show_status_message(f"Connected to {resource_name}")
             else:
                 QMessageBox.warning(self, "Connection Error", 
                                   "Failed to connect to oscilloscope")
@@ -544,14 +741,18 @@ class MainWindow(QMainWindow):
             self.stop_data_updates()
             self.oscilloscope.disconnect()
             self.instrument_connected.emit(False)
-            self.statusBar().showMessage("Disconnected")
+            self.show_status_message("Disconnected")
         except Exception as e:
             QMessageBox.critical(self, "Disconnect Error", f"Error: {str(e)}")
             
     def on_connection_changed(self, connected: bool):
         """Handle connection state change"""
+        # The instrument state is unknown across a (re)connection
+        for sent in self._last_sent.values():
+            sent.clear()
+            
         # Update UI elements
-        self.connect_action.setText("Disconnect" if connected else "Connect")
+        self.update_connection_status(connected)
         self.run_action.setEnabled(connected)
         self.stop_action.setEnabled(connected)
         self.single_action.setEnabled(connected)
@@ -586,6 +787,9 @@ class MainWindow(QMainWindow):
             for channel in range(1, 5):
                 info = self.oscilloscope.get_channel_info(channel)
                 self.channel_widget.update_channel_info(channel, info)
+            
+            # The widgets update silently, so pick up enabled states here
+            self.refresh_enabled_channels()
                 
             # Load system settings
             sys_info = self.oscilloscope.get_system_info()
@@ -593,44 +797,65 @@ class MainWindow(QMainWindow):
             self.trigger_widget.update_settings(sys_info)
             
         except Exception as e:
-            print(f"Error loading settings: {e}")
+            logger.error("Error loading settings: %s", e)
+            
+    def refresh_enabled_channels(self):
+        """Recompute the cached enabled-channel tuple"""
+        enabled = tuple(
+            ch for ch in range(1, 5) if self.channel_widget.is_channel_enabled(ch)
+        )
+        if enabled == self._enabled_channels:
+            return
+        self._enabled_channels = enabled
+        
+        if self.acquisition_worker is not None:
+            self.acquisition_worker.set_channels(self._enabled_channels)
             
     def update_channel_settings(self, channel: int, settings: dict):
         """Update channel settings on oscilloscope"""
+        if 'enabled' in settings:
+            self.refresh_enabled_channels()
+            
+        sent = self._last_sent['ch'].setdefault(channel, {})
         try:
-            if 'enabled' in settings:
-                self.oscilloscope.set_channel_enable(channel, settings['enabled'])
-            if 'scale' in settings:
-                self.oscilloscope.set_vertical_scale(channel, settings['scale'])
-            if 'position' in settings:
-                self.oscilloscope.set_vertical_position(channel, settings['position'])
-            if 'coupling' in settings:
-                self.oscilloscope.set_coupling(channel, settings['coupling'])
+            self._send_setting(sent, settings, 'enabled',
+                               lambda v: self.oscilloscope.set_channel_enable(channel, v))
+            self._send_setting(sent, settings, 'scale',
+                               lambda v: self.oscilloscope.set_vertical_scale(channel, v))
+            self._send_setting(sent, settings, 'position',
+                               lambda v: self.oscilloscope.set_vertical_position(channel, v))
+            self._send_setting(sent, settings, 'coupling',
+                               lambda v: self.oscilloscope.set_coupling(channel, v))
         except Exception as e:
             QMessageBox.warning(self, "Settings Error", f"Error: {str(e)}")
             
     def update_timebase_settings(self, settings: dict):
         """Update timebase settings on oscilloscope"""
+        sent = self._last_sent['tb']
         try:
-            if 'scale' in settings:
-                self.oscilloscope.set_timebase_scale(settings['scale'])
-            if 'position' in settings:
-                self.oscilloscope.set_timebase_position(settings['position'])
+            self._send_setting(sent, settings, 'scale', self.oscilloscope.set_timebase_scale)
+            self._send_setting(sent, settings, 'position', self.oscilloscope.set_timebase_position)
         except Exception as e:
             QMessageBox.warning(self, "Settings Error", f"Error: {str(e)}")
             
     def update_trigger_settings(self, settings: dict):
         """Update trigger settings on oscilloscope"""
+        sent = self._last_sent['trg']
         try:
-            if 'source' in settings:
-                self.oscilloscope.set_trigger_source(settings['source'])
-            if 'level' in settings:
-                self.oscilloscope.set_trigger_level(settings['level'])
-            if 'slope' in settings:
-                self.oscilloscope.set_trigger_slope(settings['slope'])
+            self._send_setting(sent, settings, 'source', self.oscilloscope.set_trigger_source)
+            self._send_setting(sent, settings, 'level', self.oscilloscope.set_trigger_level)
+            self._send_setting(sent, settings, 'slope', self.oscilloscope.set_trigger_slope)
         except Exception as e:
             QMessageBox.warning(self, "Settings Error", f"Error: {str(e)}")
             
+    @staticmethod
+    def _send_setting(sent: dict, settings: dict, key: str, setter):
+        """Write settings[key] via setter unless it equals the value last sent"""
+        if key not in settings or sent.get(key) == settings[key]:
+            return
+        setter(settings[key])
+        sent[key] = settings[key]
+        
     def run_acquisition(self):
         """Start continuous acquisition"""
         try:
@@ -653,42 +878,110 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Acquisition Error", f"Error: {str(e)}")
             
     def start_data_updates(self):
-        """Start periodic data updates"""
-        self.update_timer.start(100)  # Update every 100ms
+        """Start background acquisition; frames are rendered as they arrive"""
+        self.acquisition_worker = AcquisitionWorker(self.oscilloscope, interval_ms=100)
+        self.acquisition_worker.set_channels(self._enabled_channels)
+        self.acquisition_thread = QThread()
+        self.acquisition_worker.moveToThread(self.acquisition_thread)
+        self.acquisition_thread.started.connect(self.acquisition_worker.run)
+        
+        # Queued to the GUI thread; no frame, no render
+        self.acquisition_worker.frame_ready.connect(self.render_data)
+        self.acquisition_worker.acquisition_failed.connect(self.on_acquisition_failed)
+        self.acquisition_thread.start()
+        
+    def on_acquisition_failed(self):
+        """Stop live updates after the worker gave up on the instrument"""
+        self.stop_data_updates()
+        self.show_status_message("Live updates stopped: instrument errors")
+        
+    def stop_data_updates(self, timeout_ms: int | None = None) -> bool:
+        """
+        Stop background acquisition and display updates
+        
+        Args:
+            timeout_ms: Maximum time to wait for the worker thread, or None
+                       to wait until it exits. A thread still stuck in
+                       instrument I/O is left to exit on its own once the
+                       VISA timeout fires.
+                       
+        Returns:
+            bool: False if the worker thread was still running at the timeout
+        """
+        stopped = True
+        if self.acquisition_thread is not None:
+            self.acquisition_worker.stop()
+            self.acquisition_thread.quit()
+            if timeout_ms is None:
+                self.acquisition_thread.wait()
+            elif not self.acquisition_thread.wait(timeout_ms):
+                # Never terminate it: it may hold the instrument's io_lock.
+                # Keep the objects alive (a running QThread must not be
+                # destroyed) and let the loop exit after its current read.
+                logger.warning("Acquisition thread did not stop within %d ms", timeout_ms)
+                self._stalled_acquisition.append((self.acquisition_thread, self.acquisition_worker))
+                stopped = False
+            self.acquisition_thread = None
+            self.acquisition_worker = None
+        return stopped
+        
+    def set_updates_paused(self, paused: bool):
+        """Pause polling and rendering; the instrument keeps acquiring"""
+        if self.acquisition_worker is None:
+            return
+            
+        self.acquisition_worker.set_paused(paused)
+            
+    def showEvent(self, event):
+        """Resume live updates when the window becomes visible"""
+        super().showEvent(event)
+        self.set_updates_paused(False)
         
-    def stop_data_updates(self):
-        """Stop periodic data updates"""
-        self.update_timer.stop()
+    def hideEvent(self, event):
+        """Skip live updates while the window is hidden or minimized"""
+        super().hideEvent(event)
+        self.set_updates_paused(True)
         
-    def update_data(self):
-        """Update waveform and measurement data"""
+    def render_data(self):
+        """
+        Display the latest acquired waveform and measurement data
+        
+        Acquisition runs in AcquisitionWorker.acquire_data on the worker
+        thread; frames produced between two renders are dropped, not queued.
+        """
         try:
-            # Update waveform data for enabled channels
-            waveform_data = {}
-            for channel in range(1, 5):
-                if self.channel_widget.is_channel_enabled(channel):
-                    time_data, voltage_data = self.oscilloscope.get_waveform_data(channel)
-                    waveform_data[channel] = (time_data, voltage_data)
-                    
+            # Only the most recent frame is shown; older ones are dropped.
+            # A notification can outlive stop_data_updates in the event queue
+            if self.acquisition_worker is None:
+                return
+            frame = self.acquisition_worker.take_latest()
+            if frame is None:
+                return
+            waveform_data, measurements = frame
+            
             self.waveform_widget.update_waveforms(waveform_data)
             
-            # Update measurements
-            measurements = {}
-            for channel in range(1, 5):
-                if self.channel_widget.is_channel_enabled(channel):
-                    measurements[channel] = {
-                        'frequency': self.oscilloscope.measure_frequency(channel),
-                        'amplitude': self.oscilloscope.measure_amplitude(channel),
-                        'mean': self.oscilloscope.measure_mean(channel),
-                        'rms': self.oscilloscope.measure_rms(channel)
-                    }
-                    
-            self.measurement_widget.update_measurements(measurements)
+            # Fill the preallocated records in place
+            rows = [channel - 1 for channel in waveform_data]
+            self._meas_mask[:] = False
+            self._meas_mask[rows] = True
+            self._meas_values[rows] = measurements
             
-        except Exception as e:
-            # Silently ignore errors during live updates
-            pass
+            # Refresh the table on the next event-loop pass so paint and
+            # input are processed first; pending refreshes coalesce
+            if not self._meas_refresh_pending:
+                self._meas_refresh_pending = True
+                QTimer.singleShot(0, self.refresh_measurement_table)
             
+        except Exception:
+            # Keep live updates running; log without flooding
+            rate_limited_logger.exception("render_data", "Error during live update")
+            
+    def refresh_measurement_table(self):
+        """Show the current measurement records in the measurement table"""
+        self._meas_refresh_pending = False
+        self.measurement_widget.update_measurements(self._meas_buf, self._meas_mask)
+        
     def take_screenshot(self):
         """Take oscilloscope screenshot"""
         try:
@@ -711,10 +1004,12 @@ class MainWindow(QMainWindow):
     def toggle_grid(self, checked: bool):
         """Toggle grid display"""
         self.waveform_widget.toggle_grid(checked)
+        self._config_dirty = True
         
     def toggle_crosshair(self, checked: bool):
         """Toggle crosshair display"""
         self.waveform_widget.toggle_crosshair(checked)
+        self._config_dirty = True
         
     def clear_waveform_display(self):
         """Clear waveform display"""
@@ -722,60 +1017,74 @@ class MainWindow(QMainWindow):
         
     def show_keyboard_shortcuts(self):
         """Show keyboard shortcuts dialog"""
-        shortcuts_text = """
-Keyboard Shortcuts:
-
-File Operations:
-Ctrl+S - Save Configuration
-Ctrl+O - Load Configuration
-Ctrl+E - Export Waveform Data
-Ctrl+Shift+S - Take Screenshot
-Ctrl+Shift+P - Save Current as Preset
-Ctrl+Q - Exit
-
-View Operations:
-Ctrl+A - Auto Scale
-Ctrl+G - Toggle Grid
-Ctrl+H - Toggle Crosshair
-Ctrl+L - Clear Display
-
-Acquisition:
-F5 - Run/Stop
-F6 - Single Trigger
-
-Configuration:
-• Auto-save every 30 seconds
-• Session restore on startup
-• Preset management via toolbar
-"""
-        QMessageBox.information(self, "Keyboard Shortcuts", shortcuts_text)
+        # The message box is built once and reused
+        if self._shortcuts_msgbox is None:
+            self._shortcuts_msgbox = QMessageBox(QMessageBox.Icon.Information, "Keyboard Shortcuts",
+                                                 SHORTCUTS_TEXT, QMessageBox.StandardButton.Ok, self)
+        self._shortcuts_msgbox.exec()
             
     def save_configuration(self):
         """Save current configuration"""
         try:
-            # Update configuration from current UI state
+            # Update configuration from current UI state and write in the background
             self.update_configuration_from_ui()
-            
-            # Save current configuration
-            if self.config_manager.save_current():
-                self.statusBar().showMessage("Configuration saved successfully", 2000)
-            else:
-                QMessageBox.warning(self, "Error", "Failed to save configuration")
+            if not self.submit_configuration_save(interactive=True):
+                self.show_status_message("A configuration save is already in progress", 2000)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save configuration: {str(e)}")
+            
+    def submit_configuration_save(self, interactive: bool = False) -> bool:
+        """
+        Serialize the current configuration and write it on a pool thread
+        
+        Args:
+            interactive: Report the outcome to the user when the write finishes
+            
+        Returns:
+            bool: False if a previous save is still in flight
+        """
+        if self._save_task is not None:
+            return False
+            
+        # Serialize on the GUI thread; only the file write leaves it
+        self._save_hash = self.config_manager.content_hash()
+        self._save_task = _ConfigSaveTask(self.config_manager, self.config_manager.serialize_current())
+        self._save_task.setAutoDelete(False)
+        self._save_interactive = interactive
+        self._save_task.signals.finished.connect(self.on_configuration_saved)
+        QThreadPool.globalInstance().start(self._save_task)
+        return True
+        
+    def on_configuration_saved(self, success: bool):
+        """Handle completion of a background configuration save"""
+        self._save_task = None
+        if success:
+            self._saved_config_hash = self._save_hash
+        else:
+            self._config_dirty = True  # Retry on the next auto-save tick
+        
+        if not self._save_interactive:
+            if not success:
+                logger.error("Auto-save failed")
+        elif success:
+            self.show_status_message("Configuration saved successfully", 2000)
+        else:
+            QMessageBox.warning(self, "Error", "Failed to save configuration")
         
     def load_configuration(self):
         """Load configuration"""
         filename, _ = QFileDialog.getOpenFileName(
             self, "Load Configuration", 
-            "", "JSON files (*.json);;All files (*.*)"
+            "", "JSON files (*.json);;All files (*.*)",
+            options=FILE_DIALOG_OPTIONS
         )
         
         if filename:
             try:
                 if self.config_manager.import_configuration(filename):
                     self.apply_configuration_to_ui()
-                    self.statusBar().showMessage(f"Configuration loaded from {filename}", 2000)
+                    self._config_dirty = True
+                    self.show_status_message(f"Configuration loaded from {filename}", 2000)
                 else:
                     QMessageBox.warning(self, "Error", "Failed to load configuration")
             except Exception as e:
@@ -786,8 +1095,9 @@ Configuration:
         try:
             self.config_manager.load_current()
             self.apply_configuration_to_ui()
+            self._saved_config_hash = self.config_manager.content_hash()
         except Exception as e:
-            print(f"Failed to load current configuration: {e}")
+            logger.error("Failed to load current configuration: %s", e)
             
     def update_configuration_from_ui(self):
         """Update configuration manager from current UI state"""
@@ -796,7 +1106,7 @@ Configuration:
             self.config_manager.update_display_config(
                 grid_enabled=self.waveform_widget.grid_enabled,
                 crosshair_enabled=self.waveform_widget.crosshair_enabled,
-                theme="dark"  # Default theme
+                theme=self.current_theme
             )
             
             # TODO: Update other configurations from UI widgets
@@ -804,7 +1114,7 @@ Configuration:
             # self.config_manager.update_timebase_config(...)
             
         except Exception as e:
-            print(f"Error updating configuration from UI: {e}")
+            logger.error("Error updating configuration from UI: %s", e)
             
     def apply_configuration_to_ui(self):
         """Apply configuration to UI widgets"""
@@ -822,22 +1132,32 @@ Configuration:
             # Apply timebase configs to timebase_widget
             
         except Exception as e:
-            print(f"Error applying configuration to UI: {e}")
+            logger.error("Error applying configuration to UI: %s", e)
     
     # Preset Management Methods
-    def refresh_preset_list(self):
-        """Refresh the preset combo box"""
+    def refresh_preset_list(self, refresh: bool = False):
+        """
+        Refresh the preset combo box
+        
+        Args:
+            refresh: Re-read the presets directory instead of trusting the
+                    cached listing (explicit user refresh)
+        """
+        # Programmatic repopulation must not trigger preset loads
+        self.preset_combo.blockSignals(True)
         try:
             current_text = self.preset_combo.currentText()
-            self.preset_combo.clear()
+            presets = self.config_manager.list_presets(refresh=refresh)
             
-            # Add default option
-            self.preset_combo.addItem("-- Select Preset --")
+            # Unchanged listing: keep the items and selection as they are
+            names = tuple(preset['name'] for preset in presets)
+            if names == self._listed_preset_names:
+                return
+            self._listed_preset_names = names
             
-            # Add saved presets
-            presets = self.config_manager.list_presets()
-            for preset in presets:
-                self.preset_combo.addItem(preset['name'])
+            # Default option and saved presets in a single insertion
+            self.preset_combo.clear()
+            self.preset_combo.addItems(["-- Select Preset --", *names])
                 
             # Restore selection if possible
             if current_text:
@@ -846,7 +1166,19 @@ Configuration:
                     self.preset_combo.setCurrentIndex(index)
                     
         except Exception as e:
-            print(f"Error refreshing preset list: {e}")
+            logger.error("Error refreshing preset list: %s", e)
+        finally:
+            self.preset_combo.blockSignals(False)
+            
+    def on_preset_selection_changed(self, preset_name):
+        """Schedule loading of the selected preset"""
+        self._pending_preset = preset_name
+        self._preset_debounce.start()
+        
+    def _apply_pending_preset(self):
+        """Load the most recently selected preset"""
+        preset_name, self._pending_preset = self._pending_preset, None
+        self.load_selected_preset(preset_name)
             
     def load_selected_preset(self, preset_name):
         """Load selected preset"""
@@ -856,7 +1188,8 @@ Configuration:
         try:
             if self.config_manager.load_preset(preset_name):
                 self.apply_configuration_to_ui()
-                self.statusBar().showMessage(f"Loaded preset: {preset_name}", 2000)
+                self._config_dirty = True
+                self.show_status_message(f"Loaded preset: {preset_name}", 2000)
             else:
                 QMessageBox.warning(self, "Error", f"Failed to load preset: {preset_name}")
                 
@@ -896,7 +1229,7 @@ Configuration:
                         if index >= 0:
                             self.preset_combo.setCurrentIndex(index)
                             
-                        self.statusBar().showMessage(f"Saved preset: {preset_name}", 2000)
+                        self.show_status_message(f"Saved preset: {preset_name}", 2000)
                     else:
                         QMessageBox.warning(self, "Error", f"Failed to save preset: {preset_name}")
                         
@@ -922,7 +1255,7 @@ Configuration:
             if reply == QMessageBox.StandardButton.Yes:
                 if self.config_manager.delete_preset(current_preset):
                     self.refresh_preset_list()
-                    self.statusBar().showMessage(f"Deleted preset: {current_preset}", 2000)
+                    self.show_status_message(f"Deleted preset: {current_preset}", 2000)
                 else:
                     QMessageBox.warning(self, "Error", f"Failed to delete preset: {current_preset}")
                     
@@ -963,12 +1296,13 @@ Configuration:
             filename, _ = QFileDialog.getSaveFileName(
                 self, "Export All Presets",
                 f"rtb2000_presets_{self.config_manager.current_config.created[:10]}.json",
-                "JSON files (*.json);;All files (*.*)"
+                "JSON files (*.json);;Compressed JSON files (*.json.gz);;All files (*.*)",
+                options=FILE_DIALOG_OPTIONS
             )
             
             if filename:
                 if self.config_manager.export_configuration(filename, include_presets=True):
-                    self.statusBar().showMessage(f"Exported all presets to {filename}", 3000)
+                    self.show_status_message(f"Exported all presets to {filename}", 3000)
                     QMessageBox.information(self, "Success", f"All presets exported to:\n{filename}")
                 else:
                     QMessageBox.warning(self, "Error", "Failed to export presets")
@@ -981,13 +1315,14 @@ Configuration:
         try:
             filename, _ = QFileDialog.getOpenFileName(
                 self, "Import Presets",
-                "", "JSON files (*.json);;All files (*.*)"
+                "", "JSON files (*.json *.json.gz);;All files (*.*)",
+                options=FILE_DIALOG_OPTIONS
             )
             
             if filename:
                 if self.config_manager.import_configuration(filename, import_presets=True):
                     self.refresh_preset_list()
-                    self.statusBar().showMessage(f"Imported presets from {filename}", 3000)
+                    self.show_status_message(f"Imported presets from {filename}", 3000)
                     QMessageBox.information(self, "Success", f"Presets imported from:\n{filename}")
                 else:
                     QMessageBox.warning(self, "Error", "Failed to import presets")
@@ -997,32 +1332,37 @@ Configuration:
             
     def apply_professional_styling(self):
         """Apply professional styling to the application"""
-        # Apply theme stylesheet
-        stylesheet = get_theme_stylesheet(self.current_theme)
-        self.setStyleSheet(stylesheet)
+        # Apply theme stylesheet once at application level
+        self.apply_theme_stylesheet()
         
         # Set professional window properties
         self.setWindowFlags(Qt.WindowType.Window | Qt.WindowType.WindowCloseButtonHint | 
                            Qt.WindowType.WindowMinimizeButtonHint | Qt.WindowType.WindowMaximizeButtonHint)
         
-        # Configure status bar
-        self.statusBar().setStyleSheet("""
-            QStatusBar {
-                background-color: #2d2d30;
-                color: #cccccc;
-                border-top: 1px solid #3e3e42;
-                padding: 4px;
-            }
-        """)
-        
         # Add professional status indicators
         self.add_status_indicators()
         
+    def apply_theme_stylesheet(self):
+        """Apply the current theme's stylesheet to the application"""
+        if self.current_theme == self._applied_theme:
+            return  # Re-setting an identical stylesheet still re-polishes every widget
+        QApplication.instance().setStyleSheet(self.get_cached_stylesheet(self.current_theme))
+        self._applied_theme = self.current_theme
+        
+    def get_cached_stylesheet(self, theme_name: str) -> str:
+        """Get the full application stylesheet for a theme, building it once"""
+        stylesheet = self._theme_cache.get(theme_name)
+        if stylesheet is None:
+            stylesheet = get_theme_stylesheet(theme_name) + STATUS_BAR_STYLE
+            MainWindow._theme_cache[theme_name] = stylesheet
+        return stylesheet
+        
     def add_status_indicators(self):
         """Add professional status indicators to status bar"""
         # Connection status indicator
         self.connection_status_label = QLabel()
         self.connection_status_label.setProperty("class", "status-label")
+        self._shown_connection_state = None
         self.update_connection_status(False)
         self.statusBar().addPermanentWidget(self.connection_status_label)
         
@@ -1030,6 +1370,7 @@ Configuration:
         self.performance_status_label = QLabel("Performance: Good")
         self.performance_status_label.setProperty("class", "status-label")
         self.performance_status_label.setToolTip("Real-time performance monitoring")
+        self.performance_status_label.installEventFilter(self)  # Detailed tooltip on demand
         self.statusBar().addPermanentWidget(self.performance_status_label)
         
         # Memory usage indicator
@@ -1045,9 +1386,9 @@ Configuration:
         self.statusBar().addPermanentWidget(self.fps_status_label)
         
         # Theme indicator
-        theme_status = QLabel(f"Theme: {self.current_theme.title()}")
-        theme_status.setProperty("class", "status-label")
-        self.statusBar().addPermanentWidget(theme_status)
+        self.theme_status_label = QLabel(f"Theme: {self.current_theme.title()}")
+        self.theme_status_label.setProperty("class", "status-label")
+        self.statusBar().addPermanentWidget(self.theme_status_label)
         
         # Version indicator
         version_label = QLabel("v2.0 Professional")
@@ -1055,7 +1396,12 @@ Configuration:
         self.statusBar().addPermanentWidget(version_label)
         
     def update_connection_status(self, connected):
-        """Update connection status indicator with animation"""
+        """Update connection status indicator"""
+        # Icons come from IconManager's cache; repeated states are no-ops
+        if connected == self._shown_connection_state:
+            return
+        self._shown_connection_state = connected
+        
         if connected:
             self.connection_status_label.setText("🟢 Connected")
             self.connection_status_label.setToolTip("RTB2000 instrument connected")
@@ -1067,17 +1413,6 @@ Configuration:
             self.connect_action.setIcon(IconManager.get_icon("connect"))
             self.connect_action.setText("Connect")
             
-        # Animate status change
-        self.animate_status_change()
-        
-    def animate_status_change(self):
-        """Animate status bar changes"""
-        # Simple fade effect for status updates
-        current_geometry = self.statusBar().geometry()
-        self.status_animation.setStartValue(current_geometry)
-        self.status_animation.setEndValue(current_geometry)
-        self.status_animation.start()
-    
     def update_performance_status(self, metrics):
         """Update performance status indicators"""
         # Update performance status
@@ -1086,42 +1421,54 @@ Configuration:
         
         if cpu_percent > 80 or memory_percent > 80:
             status = "Poor"
-            color = "#ff4444"
         elif cpu_percent > 60 or memory_percent > 60:
             status = "Fair"
-            color = "#ffaa00"
         else:
             status = "Good"
-            color = "#44ff44"
         
-        self.performance_status_label.setText(f"Performance: {status}")
-        self.performance_status_label.setStyleSheet(f"color: {color};")
+        self._set_label_text(self.performance_status_label, f"Performance: {status}")
+        
+        # Color comes from the global stylesheet; re-polish only on a state change
+        state = status.lower()
+        if self.performance_status_label.property("perfState") != state:
+            self.performance_status_label.setProperty("perfState", state)
+            style = self.performance_status_label.style()
+            style.unpolish(self.performance_status_label)
+            style.polish(self.performance_status_label)
         
         # Update memory indicator
         memory_mb = metrics.get('memory_mb', 0)
-        self.memory_status_label.setText(f"Memory: {memory_mb:.1f} MB")
+        self._set_label_text(self.memory_status_label, f"Memory: {memory_mb:.1f} MB")
         
         # Update FPS indicator
         fps = metrics.get('fps', 0)
-        self.fps_status_label.setText(f"FPS: {fps:.0f}")
-        
-        # Update tooltip with detailed info
-        tooltip = f"""Performance Metrics:
-CPU: {cpu_percent:.1f}%
-Memory: {memory_percent:.1f}% ({memory_mb:.1f} MB)
-FPS: {fps:.1f}
-GPU Memory: {metrics.get('gpu_memory_mb', 0):.1f} MB"""
-        self.performance_status_label.setToolTip(tooltip)
+        self._set_label_text(self.fps_status_label, f"FPS: {fps:.0f}")
+            
+    @staticmethod
+    def _set_label_text(label: QLabel, text: str):
+        """Set label text only when it differs, avoiding layout invalidation"""
+        if label.text() != text:
+            label.setText(text)
     
     def on_performance_warning(self, message):
         """Handle performance warnings"""
-        self.logger.warning(f"Performance warning: {message}")
-        self.statusBar().showMessage(f"Performance Warning: {message}", 5000)
+        logger.warning("Performance warning: %s", message)
+        self.show_status_message(f"Performance Warning: {message}", 5000)
     
     def show_performance_dialog(self):
         """Show detailed performance monitoring dialog"""
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QTextEdit, QPushButton, QHBoxLayout
+        # The dialog is built once and reused; polling follows its visibility
+        if self._perf_dialog is None:
+            self._perf_dialog = self.create_performance_dialog()
+            
+        self._perf_dialog.show()
+        self._perf_dialog.raise_()
+        self._perf_dialog.activateWindow()
+        
+        return self._perf_dialog
         
+    def create_performance_dialog(self):
+        """Create the performance monitoring dialog"""
         dialog = QDialog(self)
         dialog.setWindowTitle("Performance Monitor")
         dialog.setModal(False)
@@ -1135,20 +1482,20 @@ GPU Memory: {metrics.get('gpu_memory_mb', 0):.1f} MB"""
         layout.addWidget(metrics_label)
         
         # Real-time metrics text area
-        metrics_text = QTextEdit()
-        metrics_text.setReadOnly(True)
-        metrics_text.setMaximumHeight(200)
-        layout.addWidget(metrics_text)
+        self._perf_metrics_text = QTextEdit()
+        self._perf_metrics_text.setReadOnly(True)
+        self._perf_metrics_text.setMaximumHeight(200)
+        layout.addWidget(self._perf_metrics_text)
         
         # Control buttons
         button_layout = QHBoxLayout()
         
         optimize_btn = QPushButton("Optimize Now")
-        optimize_btn.clicked.connect(lambda: self.performance_optimizer.optimize_performance())
+        optimize_btn.clicked.connect(self.performance_optimizer.optimize_performance)
         button_layout.addWidget(optimize_btn)
         
         gc_btn = QPushButton("Force Cleanup")
-        gc_btn.clicked.connect(lambda: self.performance_optimizer.memory_optimizer.force_cleanup())
+        gc_btn.clicked.connect(self.performance_optimizer.memory_optimizer.optimize_memory)
         button_layout.addWidget(gc_btn)
         
         close_btn = QPushButton("Close")
@@ -1158,50 +1505,76 @@ GPU Memory: {metrics.get('gpu_memory_mb', 0):.1f} MB"""
         layout.addLayout(button_layout)
         dialog.setLayout(layout)
         
-        # Update metrics periodically
-        def update_metrics_display():
-            if hasattr(self, 'performance_optimizer'):
-                metrics = self.performance_optimizer.get_current_metrics()
-                text = f"""CPU Usage: {metrics.get('cpu_percent', 0):.1f}%
+        # Polling runs only while the dialog is shown and not minimized
+        self._perf_poll_timer = QTimer(dialog)
+        self._perf_poll_timer.timeout.connect(self.update_performance_dialog)
+        dialog.installEventFilter(self)
+        
+        return dialog
+        
+    def update_performance_dialog(self):
+        """Refresh the metrics shown in the performance dialog"""
+        if hasattr(self, 'performance_optimizer'):
+            metrics = self.performance_optimizer.get_current_metrics()
+            text = f"""CPU Usage: {metrics.get('cpu_percent', 0):.1f}%
 Memory Usage: {metrics.get('memory_percent', 0):.1f}% ({metrics.get('memory_mb', 0):.1f} MB)
 FPS: {metrics.get('fps', 0):.1f}
 GPU Memory: {metrics.get('gpu_memory_mb', 0):.1f} MB
 Optimization Level: {metrics.get('optimization_level', 'Standard')}
 Auto-Optimization: {'Enabled' if metrics.get('auto_optimization', False) else 'Disabled'}"""
-                metrics_text.setPlainText(text)
-        
-        # Setup timer for updates
-        from PyQt6.QtCore import QTimer
-        update_timer = QTimer()
-        update_timer.timeout.connect(update_metrics_display)
-        update_timer.start(1000)  # Update every second
-        
-        # Cleanup timer when dialog closes
-        dialog.finished.connect(update_timer.stop)
-        
-        update_metrics_display()  # Initial update
-        dialog.show()
-        
-        return dialog
+            self._perf_metrics_text.setPlainText(text)
+            
+    def set_performance_polling(self, active: bool):
+        """Start or stop performance dialog polling"""
+        if active:
+            if not self._perf_poll_timer.isActive():
+                self.update_performance_dialog()
+                self._perf_poll_timer.start(self.config_manager.current_config.display.perf_poll_ms)
+        else:
+            self._perf_poll_timer.stop()
+            
+    def eventFilter(self, obj, event):
+        """Tie performance dialog polling to its visibility; fill tooltips on demand"""
+        if obj is self.performance_status_label:
+            # Build the detailed tooltip only when it is about to be shown
+            if event.type() == QEvent.Type.ToolTip and self.last_performance_metrics:
+                metrics = self.last_performance_metrics
+                obj.setToolTip(PERF_TOOLTIP_FMT.format(
+                    cpu=metrics.get('cpu_percent', 0),
+                    mem_pct=metrics.get('memory_percent', 0),
+                    mem_mb=metrics.get('memory_mb', 0),
+                    fps=metrics.get('fps', 0),
+                    gpu=metrics.get('gpu_memory_mb', 0)
+                ))
+        elif obj is self._perf_dialog:
+            event_type = event.type()
+            if event_type == QEvent.Type.Show:
+                self.set_performance_polling(not obj.isMinimized())
+            elif event_type == QEvent.Type.Hide:
+                self.set_performance_polling(False)
+            elif event_type == QEvent.Type.WindowStateChange:
+                self.set_performance_polling(obj.isVisible() and not obj.isMinimized())
+                
+        return super().eventFilter(obj, event)
     
     def toggle_auto_optimization(self, enabled):
         """Toggle automatic performance optimization"""
         if hasattr(self, 'performance_optimizer'):
             self.performance_optimizer.set_auto_optimization(enabled)
             status = "enabled" if enabled else "disabled"
-            self.statusBar().showMessage(f"Auto-optimization {status}", 3000)
-            self.logger.info(f"Auto-optimization {status}")
+            self.show_status_message(f"Auto-optimization {status}", 3000)
+            logger.info("Auto-optimization %s", status)
     
     def on_optimization_performed(self, results):
         """Handle optimization performed signal"""
         memory_result = results.get('memory', 0)
         if memory_result > 0:
-            self.statusBar().showMessage(f"Optimization completed: {memory_result:.1f} MB freed", 3000)
-            self.logger.info(f"Performance optimization freed {memory_result:.1f} MB")
+            self.show_status_message(f"Optimization completed: {memory_result:.1f} MB freed", 3000)
+            logger.info("Performance optimization freed %.1f MB", memory_result)
     
     def on_fps_limit_changed(self, new_limit):
         """Handle FPS limit change"""
-        self.logger.info(f"FPS limit adjusted to: {new_limit} ms interval")
+        logger.info("FPS limit adjusted to: %s ms interval", new_limit)
     
     def on_performance_metrics_updated(self, metrics):
         """Handle updated performance metrics"""
@@ -1218,11 +1591,26 @@ Auto-Optimization: {'Enabled' if metrics.get('auto_optimization', False) else 'D
             else:
                 metrics_dict = metrics
             
-            # Update performance status indicators
-            self.update_performance_status(metrics_dict)
+            # Keep only the newest metrics; the flush timer applies them
+            self._pending_metrics = metrics_dict
+            if not self._metrics_flush_timer.isActive():
+                self._metrics_flush_timer.start()
+            
+        except Exception as e:
+            logger.error("Error updating performance metrics: %s", e)
             
+    def flush_performance_metrics(self):
+        """Apply the most recent pending metrics to the status indicators"""
+        metrics_dict = self._pending_metrics
+        if metrics_dict is None:
+            return
+        self._pending_metrics = None
+        self.last_performance_metrics = metrics_dict
+        
+        try:
+            self.update_performance_status(metrics_dict)
         except Exception as e:
-            self.logger.error(f"Error updating performance metrics: {e}")
+            logger.error("Error updating performance metrics: %s", e)
         
         
     def change_theme(self, theme_name):
@@ -1234,27 +1622,41 @@ Auto-Optimization: {'Enabled' if metrics.get('auto_optimization', False) else 'D
         }
         
         if theme_name in theme_map:
+            # Spurious currentTextChanged for the active theme: nothing to do
+            if theme_map[theme_name] == self._applied_theme:
+                return
             self.current_theme = theme_map[theme_name]
-            self.apply_professional_styling()
+            self._config_dirty = True
+            
+            # Restyle and swap icons in place; menus and toolbar are not rebuilt
+            self.apply_theme_stylesheet()
+            self.refresh_action_icons()
             
             # Update theme status
-            theme_status = self.statusBar().findChild(QLabel)
-            if theme_status:
-                theme_status.setText(f"Theme: {theme_name}")
+            self.theme_status_label.setText(f"Theme: {theme_name}")
                 
-            self.statusBar().showMessage(f"Theme changed to {theme_name}", 2000)
+            self.show_status_message(f"Theme changed to {theme_name}", 2000)
             
-            # Save theme preference to configuration
+            # Theme preference is written by the background auto-save
             try:
                 self.config_manager.update_display_config(theme=self.current_theme)
-                self.config_manager.save_current()
             except Exception as e:
-                print(f"Failed to save theme preference: {e}")
+                logger.error("Failed to save theme preference: %s", e)
                 
     def show_settings_dialog(self):
         """Show application settings dialog"""
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, QPushButton, QCheckBox
+        # Built once; reopening only refreshes the current-value bindings
+        if self._settings_dialog is None:
+            self._settings_dialog = self.create_settings_dialog()
+            
+        self._settings_theme_combo.blockSignals(True)
+        self._settings_theme_combo.setCurrentText(self.current_theme.title())
+        self._settings_theme_combo.blockSignals(False)
+        
+        self._settings_dialog.exec()
         
+    def create_settings_dialog(self):
+        """Create the application settings dialog"""
         dialog = QDialog(self)
         dialog.setWindowTitle("RTB2000 Settings")
         dialog.setWindowIcon(IconManager.get_icon("settings"))
@@ -1268,11 +1670,11 @@ Auto-Optimization: {'Enabled' if metrics.get('auto_optimization', False) else 'D
         
         # Theme selection
         theme_layout.addWidget(QLabel("Theme:"))
-        theme_combo = QComboBox()
-        theme_combo.addItems(["Dark", "Light", "High Contrast"])
-        theme_combo.setCurrentText(self.current_theme.title())
-        theme_combo.currentTextChanged.connect(self.change_theme)
-        theme_layout.addWidget(theme_combo)
+        self._settings_theme_combo = QComboBox()
+        self._settings_theme_combo.addItems(["Dark", "Light", "High Contrast"])
+        self._settings_theme_combo.setCurrentText(self.current_theme.title())
+        self._settings_theme_combo.currentTextChanged.connect(self.change_theme)
+        theme_layout.addWidget(self._settings_theme_combo)
         
         layout.addWidget(theme_group)
         
@@ -1303,7 +1705,9 @@ Auto-Optimization: {'Enabled' if metrics.get('auto_optimization', False) else 'D
         
         layout.addLayout(button_layout)
         
-        dialog.exec()
+        return dialog
+        
+    def show_about_dialog(self):
         """Show enhanced about dialog"""
         about_text = """
         <h3>RTB2000 Oscilloscope Control</h3>
@@ -1337,45 +1741,61 @@ Auto-Optimization: {'Enabled' if metrics.get('auto_optimization', False) else 'D
         
     def show_about(self):
         """Show about dialog"""
-        QMessageBox.about(self, "About RTB2000 Control",
-                         "RTB2000 Oscilloscope Control GUI\n\n"
-                         "Version 2.0 Enhanced Edition\n"
-                         "Built with PyQt6, PyVISA, and PyQtGraph\n\n"
-                         "Features:\n"
-                         "• High-performance real-time waveform display\n"
-                         "• Interactive cursors and measurements\n"
-                         "• Professional data export capabilities\n"
-                         "• Advanced configuration management\n"
-                         "• Keyboard shortcuts for productivity\n\n"
-                         "© 2025 RTB2000 Project")
+        QMessageBox.about(self, "About RTB2000 Control", ABOUT_TEXT)
                          
     def closeEvent(self, a0: QCloseEvent | None):
         """Handle application close"""
         try:
-            # Auto-save current configuration before closing
+            # Auto-save current configuration before closing, after any
+            # background save so the two writes cannot interleave
+            if self._save_task is not None:
+                QThreadPool.globalInstance().waitForDone(2000)
             self.update_configuration_from_ui()
-            self.config_manager.save_current()
             
+            # Slow disks and hung VISA sessions must not block the exit
+            payload = self.config_manager.serialize_current()
+            if not _run_bounded(lambda: self.config_manager.write_current(payload), 2.0):
+                logger.warning("Configuration save did not finish before close")
+                
             # Disconnect instrument
             if self.oscilloscope.is_connected():
-                self.disconnect_instrument()
+                if not self.stop_data_updates(timeout_ms=2000):
+                    # The stalled worker still uses the session; closing it
+                    # underneath would block on io_lock or break its read
+                    logger.warning("Skipping instrument disconnect: acquisition still in I/O")
+                elif not _run_bounded(self.oscilloscope.disconnect, 2.0):
+                    logger.warning("Instrument disconnect did not finish before close")
                 
         except Exception as e:
-            print(f"Error during application close: {e}")
+            logger.error("Error during application close: %s", e)
             
         if a0:
             a0.accept()
             
     def auto_save_configuration(self):
         """Auto-save configuration periodically"""
+        # Idle session, or the previous save is still being written
+        if not self._config_dirty or self._save_task is not None:
+            return
+            
         try:
             self.update_configuration_from_ui()
-            self.config_manager.save_current()
+            self._config_dirty = False
+            
+            # Dirty but equivalent to what is on disk (e.g. a toggle undone)
+            if self.config_manager.content_hash() == self._saved_config_hash:
+                return
+            self.submit_configuration_save()
         except Exception as e:
-            print(f"Auto-save failed: {e}")
+            logger.error("Auto-save failed: %s", e)
             
     def setup_auto_save(self):
         """Setup auto-save timer"""
+        # Background configuration write in flight, if any
+        self._save_task = None
+        self._save_interactive = False
+        self._save_hash = None
+        
         self.auto_save_timer = QTimer()
         self.auto_save_timer.timeout.connect(self.auto_save_configuration)
         self.auto_save_timer.start(30000)  # Auto-save every 30 seconds
@@ -3,6 +3,7 @@ Main Window for RTB2000 Oscilloscope Control GUI
 """
 
 import sys
+import numpy as np
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QTabWidget, QMenuBar, QStatusBar, QToolBar,
                              QMessageBox, QSplitter, QFileDialog)
@@ -14,7 +15,7 @@ from .channel_control_widget import ChannelControlWidget
 from .timebase_widget import TimebaseWidget
 from .trigger_widget import TriggerWidget
 from .waveform_widget import WaveformWidget
-from .measurement_widget import MeasurementWidget
+from .measurement_widget import MeasurementWidget, MEASUREMENT_DTYPE
 from ..instruments.rtb2000 import RTB2000
 
 
@@ -321,17 +322,15 @@ class MainWindow(QMainWindow):
             self.waveform_widget.update_waveforms(waveform_data)
             
             # Update measurements
-            measurements = {}
-            for channel in range(1, 5):
-                if self.channel_widget.is_channel_enabled(channel):
-                    measurements[channel] = {
-                        'frequency': self.oscilloscope.measure_frequency(channel),
-                        'amplitude': self.oscilloscope.measure_amplitude(channel),
-                        'mean': self.oscilloscope.measure_mean(channel),
-                        'rms': self.oscilloscope.measure_rms(channel)
-                    }
+            channels = list(waveform_data)
+            rows = [channel - 1 for channel in channels]
+            measurements = np.zeros(4, dtype=MEASUREMENT_DTYPE)
+            enabled = np.zeros(4, dtype=bool)
+            enabled[rows] = True
+            measurements.view(np.float64).reshape(4, -1)[rows] = \
+                self.oscilloscope.measure_batch_values(channels)
                     
-            self.measurement_widget.update_measurements(measurements)
+            self.measurement_widget.update_measurements(measurements, enabled)
             
         except Exception as e:
             # Silently ignore errors during live updates
@@ -2,11 +2,20 @@
 Measurement Widget
 """
 
+import numpy as np
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QGroupBox, QGridLayout, QTableWidget, QTableWidgetItem)
+                             QGroupBox, QGridLayout)
 from PyQt6.QtCore import Qt
 
 
+# Measurement record layout, in table column order
+MEASUREMENT_FIELDS = ('frequency', 'amplitude', 'mean', 'rms')
+MEASUREMENT_DTYPE = np.dtype([(name, 'f8') for name in MEASUREMENT_FIELDS])
+
+# Bound format methods, one per column, created once instead of per update
+MEASUREMENT_FORMATTERS = ("{:.2f}".format, "{:.3f}".format, "{:.3f}".format, "{:.3f}".format)
+
+
 class MeasurementWidget(QWidget):
     """Widget for displaying measurements"""
     
@@ -25,61 +34,62 @@ class MeasurementWidget(QWidget):
         group.setLayout(group_layout)
         layout.addWidget(group)
         
-        # Create measurement table
-        self.measurement_table = QTableWidget()
-        self.measurement_table.setColumnCount(5)
-        self.measurement_table.setHorizontalHeaderLabels([
-            "Channel", "Frequency (Hz)", "Amplitude (V)", "Mean (V)", "RMS (V)"
-        ])
-        self.measurement_table.setRowCount(4)  # 4 channels
-        
-        # Set channel labels
-        for i in range(4):
-            item = QTableWidgetItem(f"CH{i+1}")
-            item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            self.measurement_table.setItem(i, 0, item)
+        # Fixed 4x4 grid of labels: read-only values need no item model
+        grid = QGridLayout()
+        grid.setHorizontalSpacing(12)
+        headers = ["Channel", "Frequency (Hz)", "Amplitude (V)", "Mean (V)", "RMS (V)"]
+        for col, text in enumerate(headers):
+            header = QLabel(text)
+            header.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            grid.addWidget(header, 0, col)
+            
+        # Value labels are created once; updates only change their text.
+        # A minimum width sized for the widest expected value keeps the
+        # grid geometry stable as values change.
+        value_width = self.fontMetrics().horizontalAdvance("-000000000.000")
+        self._cells = []
+        for row in range(4):
+            grid.addWidget(QLabel(f"CH{row+1}"), row + 1, 0)
+            
+            row_cells = []
+            for col in range(1, 5):
+                label = QLabel("---")
+                label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                label.setMinimumWidth(value_width)
+                grid.addWidget(label, row + 1, col)
+                row_cells.append(label)
+            self._cells.append(row_cells)
             
-        group_layout.addWidget(self.measurement_table)
+        group_layout.addLayout(grid)
+        group_layout.addStretch()
         
-    def update_measurements(self, measurements: dict):
+    def update_measurements(self, measurements: np.ndarray, enabled: np.ndarray):
         """
         Update measurement display
         
         Args:
-            measurements: Dictionary with channel numbers as keys,
-                         measurement dictionaries as values
+            measurements: Structured array of MEASUREMENT_DTYPE, one record
+                         per channel (row 0 = CH1)
+            enabled: Boolean mask of rows holding valid measurements
         """
-        for channel, data in measurements.items():
-            row = channel - 1  # Convert to 0-based index
-            
-            # Update frequency
-            if 'frequency' in data:
-                item = QTableWidgetItem(f"{data['frequency']:.2f}")
-                item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                self.measurement_table.setItem(row, 1, item)
-                
-            # Update amplitude
-            if 'amplitude' in data:
-                item = QTableWidgetItem(f"{data['amplitude']:.3f}")
-                item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                self.measurement_table.setItem(row, 2, item)
-                
-            # Update mean
-            if 'mean' in data:
-                item = QTableWidgetItem(f"{data['mean']:.3f}")
-                item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                self.measurement_table.setItem(row, 3, item)
-                
-            # Update RMS
-            if 'rms' in data:
-                item = QTableWidgetItem(f"{data['rms']:.3f}")
-                item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                self.measurement_table.setItem(row, 4, item)
+        # One repaint for the whole batch instead of one per label
+        self.setUpdatesEnabled(False)
+        try:
+            for row in np.flatnonzero(enabled):
+                # One record as a tuple of Python floats, in column order
+                values = measurements[row].item()
                 
+                for cell, fmt, value in zip(self._cells[row], MEASUREMENT_FORMATTERS, values):
+                    cell.setText(fmt(value))
+        finally:
+            self.setUpdatesEnabled(True)
+            
     def clear_measurements(self):
         """Clear all measurements"""
-        for row in range(4):
-            for col in range(1, 5):
-                item = QTableWidgetItem("---")
-                item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                self.measurement_table.setItem(row, col, item)
+        self.setUpdatesEnabled(False)
+        try:
+            for row_cells in self._cells:
+                for cell in row_cells:
+                    cell.setText("---")
+        finally:
+            self.setUpdatesEnabled(True)
@@ -0,0 +1,44 @@
+"""
+Settings Throttle
+"""
+
+from PyQt6.QtCore import QObject, QTimer
+
+# Spin box drags produce a value per step; only the latest value in each
+# window is sent on to the instrument
+SETTINGS_THROTTLE_MS = 100
+
+
+class SettingsThrottle(QObject):
+    """Coalesces rapid settings changes into one emission per throttle window"""
+
+    def __init__(self, emit, parent: QObject = None):
+        """
+        Args:
+            emit: Called with the merged settings dict, preceded by the key
+                if the settings were queued with one
+            parent: Owning widget
+        """
+        super().__init__(parent)
+        self._emit = emit
+        self._pending = {}  # {key: {setting: value}}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(SETTINGS_THROTTLE_MS)
+        self._timer.timeout.connect(self.flush)
+
+    def queue(self, settings: dict, key=None):
+        """Queue settings for the next throttled emission"""
+        self._pending.setdefault(key, {}).update(settings)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """Emit the settings queued since the last emission"""
+        self._timer.stop()
+        pending, self._pending = self._pending, {}
+        for key, settings in pending.items():
+            if key is None:
+                self._emit(settings)
+            else:
+                self._emit(key, settings)
@@ -3,6 +3,14 @@ Professional Styling System for RTB2000 Application
 Advanced QSS Themes with Professional Design Language
 """
 
+import re
+
+
+def _minify(qss):
+    """Strip comments and collapse whitespace so Qt's CSS parser sees fewer bytes"""
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.S)
+    return re.sub(r"\s+", " ", qss).strip()
+
 # Dark Professional Theme
 DARK_PROFESSIONAL_THEME = """
 /* Main Application Styling */
@@ -481,22 +489,32 @@ QPushButton:hover {
 /* Continue with high contrast elements... */
 """
 
+# Minify once at import; every setStyleSheet call then parses the short form
+DARK_PROFESSIONAL_THEME = _minify(DARK_PROFESSIONAL_THEME)
+LIGHT_PROFESSIONAL_THEME = _minify(LIGHT_PROFESSIONAL_THEME)
+HIGH_CONTRAST_THEME = _minify(HIGH_CONTRAST_THEME)
+
+# Stylesheets are complete at import time; lookups return the same string
+THEME_STYLESHEETS = {
+    "dark": DARK_PROFESSIONAL_THEME,
+    "light": LIGHT_PROFESSIONAL_THEME,
+    "high_contrast": HIGH_CONTRAST_THEME
+}
+
 # Theme management functions
 def get_theme_stylesheet(theme_name="dark"):
     """Get stylesheet for specified theme"""
-    themes = {
-        "dark": DARK_PROFESSIONAL_THEME,
-        "light": LIGHT_PROFESSIONAL_THEME,
-        "high_contrast": HIGH_CONTRAST_THEME
-    }
-    
-    return themes.get(theme_name, DARK_PROFESSIONAL_THEME)
+    return THEME_STYLESHEETS.get(theme_name, DARK_PROFESSIONAL_THEME)
 
 def apply_theme_to_application(app, theme_name="dark"):
     """Apply theme to QApplication"""
     stylesheet = get_theme_stylesheet(theme_name)
+    
+    # Re-setting the same stylesheet still re-parses it and re-polishes every widget
+    if app.styleSheet() == stylesheet:
+        return
     app.setStyleSheet(stylesheet)
     
 def get_available_themes():
     """Get list of available themes"""
-    return ["dark", "light", "high_contrast"]
+    return list(THEME_STYLESHEETS)
@@ -4,7 +4,9 @@ Timebase Control Widget
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QDoubleSpinBox, QGroupBox, QGridLayout)
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import pyqtSignal, QSignalBlocker
+
+from .settings_throttle import SettingsThrottle
 
 
 class TimebaseWidget(QWidget):
@@ -15,6 +17,9 @@ class TimebaseWidget(QWidget):
     
     def __init__(self):
         super().__init__()
+        
+        self._throttle = SettingsThrottle(self.settings_changed.emit, self)
+        
         self.init_ui()
         
     def init_ui(self):
@@ -48,15 +53,18 @@ class TimebaseWidget(QWidget):
         
     def on_scale_changed(self, value: float):
         """Handle scale change"""
-        self.settings_changed.emit({'scale': value})
+        self._throttle.queue({'scale': value})
         
     def on_position_changed(self, value: float):
         """Handle position change"""
-        self.settings_changed.emit({'position': value})
+        self._throttle.queue({'position': value})
         
     def update_settings(self, settings: dict):
         """Update widget with current settings"""
+        # Values read from the instrument must not be echoed back to it
         if 'timebase_scale' in settings:
-            self.scale_spin.setValue(settings['timebase_scale'])
+            with QSignalBlocker(self.scale_spin):
+                self.scale_spin.setValue(settings['timebase_scale'])
         if 'timebase_position' in settings:
-            self.position_spin.setValue(settings['timebase_position'])
+            with QSignalBlocker(self.position_spin):
+                self.position_spin.setValue(settings['timebase_position'])
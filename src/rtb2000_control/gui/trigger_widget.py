@@ -4,7 +4,9 @@ Trigger Control Widget
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QDoubleSpinBox, QComboBox, QGroupBox, QGridLayout)
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import pyqtSignal, QSignalBlocker
+
+from .settings_throttle import SettingsThrottle
 
 
 class TriggerWidget(QWidget):
@@ -15,6 +17,9 @@ class TriggerWidget(QWidget):
     
     def __init__(self):
         super().__init__()
+        
+        self._throttle = SettingsThrottle(self.settings_changed.emit, self)
+        
         self.init_ui()
         
     def init_ui(self):
@@ -57,7 +62,7 @@ class TriggerWidget(QWidget):
         
     def on_level_changed(self, level: float):
         """Handle level change"""
-        self.settings_changed.emit({'level': level})
+        self._throttle.queue({'level': level})
         
     def on_slope_changed(self, slope: str):
         """Handle slope change"""
@@ -65,15 +70,19 @@ class TriggerWidget(QWidget):
         
     def update_settings(self, settings: dict):
         """Update widget with current settings"""
+        # Values read from the instrument must not be echoed back to it
         if 'trigger_source' in settings:
             index = self.source_combo.findText(settings['trigger_source'])
             if index >= 0:
-                self.source_combo.setCurrentIndex(index)
+                with QSignalBlocker(self.source_combo):
+                    self.source_combo.setCurrentIndex(index)
                 
         if 'trigger_level' in settings:
-            self.level_spin.setValue(settings['trigger_level'])
+            with QSignalBlocker(self.level_spin):
+                self.level_spin.setValue(settings['trigger_level'])
             
         if 'trigger_slope' in settings:
             index = self.slope_combo.findText(settings['trigger_slope'])
             if index >= 0:
-                self.slope_combo.setCurrentIndex(index)
+                with QSignalBlocker(self.slope_combo):
+                    self.slope_combo.setCurrentIndex(index)
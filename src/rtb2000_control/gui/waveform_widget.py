@@ -3,6 +3,7 @@ Enhanced Waveform Display Widget
 Version 2.0 - Integrated PyQtGraph for high-performance real-time display
 """
 
+import time
 import numpy as np
 from typing import Dict, Tuple, Optional, List
 from PyQt6.QtWidgets import (
@@ -16,7 +17,15 @@ from PyQt6.QtGui import QFont, QPalette
 
 import pyqtgraph as pg
 from pyqtgraph import PlotWidget, mkPen, mkBrush
-import pyqtgraph.exporters
+
+try:
+    import OpenGL  # noqa: F401 - only probes for PyOpenGL
+    OPENGL_AVAILABLE = True
+except ImportError:
+    OPENGL_AVAILABLE = False
+
+from ..analysis._downsample import m4_downsample
+from ..analysis._kernels import fused_basic_stats
 
 
 class WaveformWidget(QWidget):
@@ -30,13 +39,15 @@ class WaveformWidget(QWidget):
         super().__init__()
         
         # Configure PyQtGraph
-        pg.setConfigOptions(antialias=True)
+        # Live traces are drawn without antialiasing; screenshots enable it
+        pg.setConfigOptions(antialias=False)
         pg.setConfigOption('background', 'k')
         pg.setConfigOption('foreground', 'w')
         
         # Initialize data storage
         self.waveform_data = {}
         self.plot_items = {}
+        self._shown_traces = {}  # {channel: (x, y)} as last passed to setData
         self.cursors = {'vertical': [], 'horizontal': []}
         self.measurements = {}
         
@@ -47,6 +58,22 @@ class WaveformWidget(QWidget):
         self.fps_timer.start(1000)
         self.last_update_time = 0
         
+        # Frame budget tracking - drop incoming frames while painting lags
+        self.update_rate = 30  # Hz
+        self._frame_budget = 1.0 / self.update_rate
+        self._frame_slop = 0.002  # seconds of tolerated overrun
+        self._frame_start = 0.0
+        self._last_paint_time = 0.0
+        self._paint_pending = False
+        self.dropped_frames = 0
+        
+        # Redraws are spaced at least one frame budget apart; data arriving
+        # sooner is coalesced into a single deferred redraw
+        self._last_draw = 0.0
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self.draw_waveforms)
+        
         # Channel configuration
         self.channel_colors = {
             1: '#FFFF00',  # Yellow
@@ -81,10 +108,13 @@ class WaveformWidget(QWidget):
         # Bottom status bar
         status_layout = QHBoxLayout()
         self.fps_label = QLabel("FPS: 0")
+        self.dropped_label = QLabel("Dropped: 0")
         self.samples_label = QLabel("Samples: 0")
+        self._shown_total_samples = 0
         self.cursor_label = QLabel("Cursor: --")
         
         status_layout.addWidget(self.fps_label)
+        status_layout.addWidget(self.dropped_label)
         status_layout.addWidget(QLabel("|"))
         status_layout.addWidget(self.samples_label)
         status_layout.addWidget(QLabel("|"))
@@ -100,11 +130,38 @@ class WaveformWidget(QWidget):
         
         # Create plot widget
         self.plot_widget = PlotWidget()
+        
+        # Paint this plot through an OpenGL viewport when PyOpenGL is
+        # installed. Set per widget so other PlotWidgets keep their defaults;
+        # the experimental GL curve path is not used, as it ignores the
+        # segmented line mode set on the traces below.
+        if OPENGL_AVAILABLE:
+            self.plot_widget.useOpenGL(True)
+            
         self.plot_widget.setLabel('left', 'Voltage', 'V')
         self.plot_widget.setLabel('bottom', 'Time', 's')
         self.plot_widget.showGrid(x=True, y=True, alpha=0.3)
         self.plot_widget.setMouseEnabled(x=True, y=True)
-        self.plot_widget.enableAutoRange()
+        
+        # No per-setData bounds scan: the view follows the data from the
+        # cached measurement extrema on a slow timer until the user pans
+        # or zooms, and auto_scale() re-enables it
+        self.plot_widget.enableAutoRange(enable=False)
+        self._follow_data = True
+        self._view_range = None
+        self._range_timer = QTimer(self)
+        self._range_timer.timeout.connect(self.update_view_range)
+        self._range_timer.start(2000)
+        self.plot_widget.getViewBox().sigRangeChangedManually.connect(self.on_range_changed_manually)
+        
+        # Traces are decimated for the visible x range; redraw when it moves
+        self.plot_widget.getViewBox().sigXRangeChanged.connect(self.on_x_range_changed)
+        
+        # Keep Qt's backing-store double buffering on the canvas: painting
+        # directly on screen or skipping the background erase tears frames
+        viewport = self.plot_widget.viewport()
+        viewport.setAttribute(Qt.WidgetAttribute.WA_PaintOnScreen, False)
+        viewport.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
         
         # Add crosshair
         self.crosshair_v = pg.InfiniteLine(angle=90, movable=False, pen='w')
@@ -114,10 +171,43 @@ class WaveformWidget(QWidget):
         self.crosshair_v.hide()
         self.crosshair_h.hide()
         
+        # Mouse moves arrive far faster than frames; apply at most one
+        # crosshair update per ~16 ms using the latest position
+        self._pending_mouse_pos = None
+        self._crosshair_timer = QTimer(self)
+        self._crosshair_timer.setSingleShot(True)
+        self._crosshair_timer.timeout.connect(self.apply_crosshair)
+        
+        # Plot area in scene coordinates, refreshed only when its layout changes
+        self._plot_scene_rect = self.plot_widget.sceneBoundingRect()
+        self.plot_widget.plotItem.geometryChanged.connect(self.on_plot_geometry_changed)
+        
+        # Preallocate one trace per channel so updates only call setData.
+        # Scope samples are always finite, so skip PyQtGraph's per-frame
+        # isfinite scan and masked copy when building the line path.
+        for ch, color in self.channel_colors.items():
+            self.plot_items[ch] = self.plot_widget.plot(
+                np.empty(0, dtype=np.float32), np.empty(0, dtype=np.float32),
+                pen=mkPen(color=color, width=2),
+                name=f'CH{ch}',
+                skipFiniteCheck=True
+            )
+            # Only build the path for samples inside the visible x range
+            self.plot_items[ch].setClipToView(True)
+            
+            # Draw the 2 px pen as line segments rather than one wide path
+            # (PyQtGraph >= 0.13.1)
+            curve = self.plot_items[ch].curve
+            if hasattr(curve, 'setSegmentedLineMode'):
+                curve.setSegmentedLineMode('on')
+        
         # Connect mouse events
         self.plot_widget.scene().sigMouseMoved.connect(self.on_mouse_moved)
         self.plot_widget.scene().sigMouseClicked.connect(self.on_mouse_clicked)
         
+        # Track when the scene has processed the last setData
+        self.plot_widget.scene().changed.connect(self.on_scene_changed)
+        
         layout.addWidget(self.plot_widget)
         
         return widget
@@ -216,65 +306,189 @@ class WaveformWidget(QWidget):
             waveform_data: Dictionary with channel numbers as keys,
                           (time_data, voltage_data) tuples as values
         """
+        # Always keep the newest data for measurements and export, even
+        # when its paint is deferred or skipped
         self.waveform_data = waveform_data
-        self.update_count += 1
         
-        # Clear existing plot items for disabled channels
-        for ch in list(self.plot_items.keys()):
-            if ch not in waveform_data or not self.channel_enabled[ch]:
-                self.plot_widget.removeItem(self.plot_items[ch])
-                del self.plot_items[ch]
+        # A deferred redraw is already due and will pick up this data
+        if self._redraw_timer.isActive():
+            return
+            
+        remaining = self._last_draw + self._frame_budget - time.perf_counter()
+        if remaining > 0:
+            self._redraw_timer.start(int(remaining * 1000) + 1)
+            return
+            
+        self.draw_waveforms()
+        
+    def draw_waveforms(self):
+        """Draw the current waveform_data, unless the frame budget is overrun"""
+        waveform_data = self.waveform_data
+        now = time.perf_counter()
+        self._last_draw = now
+        
+        # Previous frame never reached the scene - count elapsed time instead
+        if self._paint_pending:
+            self._last_paint_time = now - self._frame_start
+            self._paint_pending = False
+            
+        # Drop this frame if the previous one overran the frame budget,
+        # so overload bounds latency instead of queueing frames
+        if self._last_paint_time > self._frame_budget + self._frame_slop:
+            self.dropped_frames += 1
+            self._last_paint_time = 0.0
+            return
+            
+        self._frame_start = now
         
-        # Update or create plot items for enabled channels
-        for channel, (time_data, voltage_data) in waveform_data.items():
-            if not self.channel_enabled[channel]:
-                continue
+        self.update_count += 1
+        
+        # Update persistent plot items; empty the traces of inactive channels.
+        # Auto-range and painting are suspended so all channels cost one
+        # range update and one repaint instead of one per channel.
+        view_box = self.plot_widget.getViewBox()
+        auto_x, auto_y = view_box.autoRangeEnabled()
+        view_box.disableAutoRange()
+        self.plot_widget.setUpdatesEnabled(False)
+        changed = False
+        try:
+            for channel in self.plot_items:
+                if channel in waveform_data and self.channel_enabled[channel]:
+                    changed |= self._set_trace(channel, *waveform_data[channel])
+                else:
+                    changed |= self._clear_plot_item(channel)
+        finally:
+            self.plot_widget.setUpdatesEnabled(True)
+            view_box.enableAutoRange(x=auto_x, y=auto_y)
                 
-            color = self.channel_colors[channel]
-            pen = mkPen(color=color, width=2)
-            
-            if channel in self.plot_items:
-                # Update existing plot
-                self.plot_items[channel].setData(time_data, voltage_data)
-            else:
-                # Create new plot
-                plot_item = self.plot_widget.plot(
-                    time_data, voltage_data,
-                    pen=pen,
-                    name=f'CH{channel}'
-                )
-                self.plot_items[channel] = plot_item
+        # An unchanged frame causes no scene change, so no paint to time
+        self._paint_pending = changed
                 
         # Update measurements
         self.update_measurements()
         
-        # Update sample count
-        total_samples = sum(len(data[1]) for data in waveform_data.values())
-        self.samples_label.setText(f"Samples: {total_samples}")
+        # Fit the first data at once rather than on the next range tick
+        if self._view_range is None:
+            self.update_view_range()
+        
+        # Update sample count; the label is only touched when it changes
+        total_samples = 0
+        for _, voltage_data in waveform_data.values():
+            total_samples += len(voltage_data)
+        if total_samples != self._shown_total_samples:
+            self._shown_total_samples = total_samples
+            self.samples_label.setText(f"Samples: {total_samples}")
         
     def toggle_channel(self, channel: int, enabled: bool):
         """Toggle channel display"""
         self.channel_enabled[channel] = enabled
         
-        if not enabled and channel in self.plot_items:
-            self.plot_widget.removeItem(self.plot_items[channel])
-            del self.plot_items[channel]
-        elif enabled and channel in self.waveform_data:
-            # Re-add the channel
-            time_data, voltage_data = self.waveform_data[channel]
-            color = self.channel_colors[channel]
-            pen = mkPen(color=color, width=2)
-            
-            plot_item = self.plot_widget.plot(
-                time_data, voltage_data,
-                pen=pen,
-                name=f'CH{channel}'
-            )
-            self.plot_items[channel] = plot_item
+        if not enabled:
+            self._clear_plot_item(channel)
+        elif channel in self.waveform_data:
+            # Restore the channel's last data
+            self._set_trace(channel, *self.waveform_data[channel])
+            
+    def pixel_width(self) -> int:
+        """Get plot area width in pixels"""
+        return max(1, int(self.plot_widget.getViewBox().width()))
+        
+    def downsample_for_display(self, time_data, voltage_data):
+        """
+        Reduce a trace to its first, min, max and last samples per pixel (M4)
+        
+        Only the drawn trace is decimated; waveform_data keeps full resolution
+        for measurements and export. Decimation covers the visible x range
+        only, so zooming in shows the real samples.
+        """
+        # Visible samples plus one on each side so the lines reach the edges
+        x_min, x_max = self.plot_widget.getViewBox().viewRange()[0]
+        start = max(int(np.searchsorted(time_data, x_min)) - 1, 0)
+        stop = min(int(np.searchsorted(time_data, x_max, side='right')) + 1, len(time_data))
+        time_data = time_data[start:stop]
+        voltage_data = voltage_data[start:stop]
+        
+        # M4 emits 4 points per bin, so bins under 4 samples gain nothing
+        ds = len(voltage_data) // self.pixel_width()
+        if ds < 4:
+            return time_data, voltage_data
+        return m4_downsample(time_data, voltage_data, ds)
+        
+    def _set_trace(self, channel: int, time_data, voltage_data) -> bool:
+        """
+        Show a trace unless it matches what the plot item already draws
+        
+        Returns:
+            True if setData was called
+        """
+        x, y = self.downsample_for_display(time_data, voltage_data)
+        
+        # Compare at display resolution: identical frames (e.g. a stopped
+        # scope) skip PyQtGraph's path rebuild and the repaint
+        shown = self._shown_traces.get(channel)
+        if shown is not None and np.array_equal(shown[1], y) and np.array_equal(shown[0], x):
+            return False
+            
+        # Keep private copies; acquisition reuses its buffers
+        if np.may_share_memory(x, time_data):
+            x, y = x.copy(), y.copy()
+        self.plot_items[channel].setData(x, y)
+        self._shown_traces[channel] = (x, y)
+        return True
+        
+    def _clear_plot_item(self, channel: int) -> bool:
+        """
+        Empty a plot item without removing it from the scene
+        
+        Returns:
+            True if the item held data
+        """
+        if self._shown_traces.pop(channel, None) is None:
+            return False
+        self.plot_items[channel].setData(x=np.empty(0, dtype=np.float32), y=np.empty(0, dtype=np.float32))
+        return True
             
     def auto_scale(self):
         """Auto-scale the plot"""
         self.plot_widget.autoRange()
+        self._follow_data = True
+        self._view_range = None
+        
+    def on_range_changed_manually(self, mouse_enabled):
+        """Stop following the data once the user pans or zooms"""
+        self._follow_data = False
+        
+    def on_x_range_changed(self, view_box, x_range):
+        """Redraw the traces for a new visible x range"""
+        if self.waveform_data:
+            self.update_waveforms(self.waveform_data)
+            
+    def update_view_range(self):
+        """Fit the view to the displayed channels from cached extrema"""
+        if not self._follow_data:
+            return
+            
+        x_min = y_min = float('inf')
+        x_max = y_max = float('-inf')
+        for channel, (time_data, voltage_data) in self.waveform_data.items():
+            stats = self.measurements.get(channel)
+            if not self.channel_enabled[channel] or stats is None or len(time_data) == 0:
+                continue
+            x_min = min(x_min, time_data[0])
+            x_max = max(x_max, time_data[-1])
+            y_min = min(y_min, stats['vmin'])
+            y_max = max(y_max, stats['vmax'])
+            
+        if x_min >= x_max:
+            return  # No data, or a single sample
+        if y_min == y_max:
+            y_min, y_max = y_min - 0.5, y_max + 0.5  # Flat trace
+            
+        view_range = (float(x_min), float(x_max), float(y_min), float(y_max))
+        if view_range == self._view_range:
+            return
+        self._view_range = view_range
+        self.plot_widget.setRange(xRange=view_range[:2], yRange=view_range[2:], padding=0.05)
         
     def toggle_grid(self, enabled: bool):
         """Toggle grid display"""
@@ -291,7 +505,21 @@ class WaveformWidget(QWidget):
             
     def on_mouse_moved(self, pos):
         """Handle mouse movement for crosshair"""
-        if self.crosshair_cb.isChecked() and self.plot_widget.sceneBoundingRect().contains(pos):
+        if not self.crosshair_cb.isChecked():
+            return
+            
+        self._pending_mouse_pos = pos
+        if not self._crosshair_timer.isActive():
+            self._crosshair_timer.start(16)
+            
+    def apply_crosshair(self):
+        """Move the crosshair to the latest mouse position"""
+        pos = self._pending_mouse_pos
+        if pos is None:
+            return
+        self._pending_mouse_pos = None
+        
+        if self._plot_scene_rect.contains(pos):
             mouse_point = self.plot_widget.plotItem.vb.mapSceneToView(pos)
             self.crosshair_v.setPos(mouse_point.x())
             self.crosshair_h.setPos(mouse_point.y())
@@ -302,6 +530,10 @@ class WaveformWidget(QWidget):
             # Emit signal
             self.cursor_moved.emit(mouse_point.x(), mouse_point.y())
             
+    def on_plot_geometry_changed(self):
+        """Refresh the cached plot area after a resize or relayout"""
+        self._plot_scene_rect = self.plot_widget.sceneBoundingRect()
+        
     def on_mouse_clicked(self, event):
         """Handle mouse clicks"""
         # Future: Add measurement cursors on click
@@ -318,10 +550,9 @@ class WaveformWidget(QWidget):
                 self.measurement_labels[channel].setText(f"CH{channel}: No Data")
                 continue
                 
-            # Calculate basic measurements
-            vpp = np.max(voltage_data) - np.min(voltage_data)
-            vrms = np.sqrt(np.mean(voltage_data**2))
-            vmean = np.mean(voltage_data)
+            # Calculate basic measurements in one pass, without a squared copy
+            vmean, vrms, vmin, vmax = fused_basic_stats(voltage_data)
+            vpp = vmax - vmin
             
             # Update display
             self.measurement_labels[channel].setText(
@@ -332,16 +563,31 @@ class WaveformWidget(QWidget):
             self.measurements[channel] = {
                 'vpp': vpp,
                 'vrms': vrms,
-                'vmean': vmean
+                'vmean': vmean,
+                'vmin': vmin,
+                'vmax': vmax
             }
             
         # Emit measurement update signal
         self.measurement_updated.emit(self.measurements)
         
+    def on_scene_changed(self, region):
+        """Record setData-to-paint time of the pending frame"""
+        if self._paint_pending:
+            self._last_paint_time = time.perf_counter() - self._frame_start
+            self._paint_pending = False
+            
+    def set_update_rate(self, rate: float):
+        """Set target display rate (Hz) used as the frame budget"""
+        if rate > 0:
+            self.update_rate = rate
+            self._frame_budget = 1.0 / rate
+            
     def update_fps(self):
         """Update FPS display"""
         fps = self.update_count
         self.fps_label.setText(f"FPS: {fps}")
+        self.dropped_label.setText(f"Dropped: {self.dropped_frames}")
         self.update_count = 0
         
     def take_screenshot(self):
@@ -351,19 +597,32 @@ class WaveformWidget(QWidget):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"waveform_screenshot_{timestamp}.png"
             
-            # Create exporter
-            exporter = pg.exporters.ImageExporter(self.plot_widget.plotItem)
+            # Create exporter; imported here to keep it off the startup path
+            import pyqtgraph.exporters
+            exporter = pyqtgraph.exporters.ImageExporter(self.plot_widget.plotItem)
             exporter.parameters()['width'] = 1920
             exporter.parameters()['height'] = 1080
             
-            # Save screenshot
-            exporter.export(filename)
+            # Save screenshot, antialiased unlike the live display
+            self._set_trace_antialiasing(True)
+            try:
+                exporter.export(filename)
+            finally:
+                self._set_trace_antialiasing(False)
             
             QMessageBox.information(self, "Screenshot", f"Screenshot saved as {filename}")
             
         except Exception as e:
             QMessageBox.warning(self, "Screenshot Error", f"Error saving screenshot: {str(e)}")
             
+    def _set_trace_antialiasing(self, enabled: bool):
+        """Switch antialiasing of the channel traces"""
+        # PlotDataItem passes its opts on to the curve at the next setData,
+        # and the curve reads its own opts at paint time - set both
+        for plot_item in self.plot_items.values():
+            plot_item.opts['antialias'] = enabled
+            plot_item.curve.opts['antialias'] = enabled
+            
     def export_data(self):
         """Export waveform data"""
         if not self.waveform_data:
@@ -388,47 +647,30 @@ class WaveformWidget(QWidget):
             
     def _export_csv(self, filename: str):
         """Export data to CSV format"""
-        import csv
+        channels = sorted(self.waveform_data.keys())
         
         # Find maximum length for time alignment
         max_length = max(len(data[0]) for data in self.waveform_data.values())
         
-        with open(filename, 'w', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Write header
-            header = ['Time']
-            for ch in sorted(self.waveform_data.keys()):
-                header.append(f'CH{ch}_Voltage')
-            writer.writerow(header)
-            
-            # Write data
-            for i in range(max_length):
-                row = []
-                
-                # Time column (use first channel's time data)
-                first_channel = min(self.waveform_data.keys())
-                time_data = self.waveform_data[first_channel][0]
-                if i < len(time_data):
-                    row.append(time_data[i])
-                else:
-                    row.append('')
-                    
-                # Voltage columns
-                for ch in sorted(self.waveform_data.keys()):
-                    voltage_data = self.waveform_data[ch][1]
-                    if i < len(voltage_data):
-                        row.append(voltage_data[i])
-                    else:
-                        row.append('')
-                        
-                writer.writerow(row)
+        def pad(values: np.ndarray) -> np.ndarray:
+            """Extend a column to max_length with NaN"""
+            return np.pad(values.astype(np.float64, copy=False),
+                          (0, max_length - len(values)), constant_values=np.nan)
+        
+        # Time column (use first channel's time data), then one voltage column
+        # per channel; the whole table is written in one call
+        columns = [pad(self.waveform_data[channels[0]][0])]
+        columns.extend(pad(self.waveform_data[ch][1]) for ch in channels)
+        
+        header = ['Time'] + [f'CH{ch}_Voltage' for ch in channels]
+        fmt = ['%.12g'] + ['%.9g'] * len(channels)
+        np.savetxt(filename, np.column_stack(columns), delimiter=',',
+                   header=','.join(header), comments='', fmt=fmt)
                 
     def clear_display(self):
         """Clear waveform display"""
-        for plot_item in self.plot_items.values():
-            self.plot_widget.removeItem(plot_item)
-        self.plot_items.clear()
+        for channel in self.plot_items:
+            self._clear_plot_item(channel)
         self.waveform_data.clear()
         
         # Reset measurements
@@ -438,6 +680,7 @@ class WaveformWidget(QWidget):
         
         # Reset status
         self.samples_label.setText("Samples: 0")
+        self._shown_total_samples = 0
         self.cursor_label.setText("Cursor: --")
         
     def get_measurements(self) -> dict:
@@ -53,27 +53,35 @@ class WaveformWidget(QWidget):
             waveform_data: Dictionary with channel numbers as keys,
                           (time_data, voltage_data) tuples as values
         """
-        # Clear existing lines
-        for line in self.waveform_lines.values():
-            line.remove()
-        self.waveform_lines.clear()
-        
-        # Plot new data
-        for channel, (time_data, voltage_data) in waveform_data.items():
-            color = self.channel_colors.get(channel, 'white')
-            line, = self.ax.plot(time_data, voltage_data, 
-                               color=color, 
-                               label=f'CH{channel}',
-                               linewidth=1.5)
-            self.waveform_lines[channel] = line
+        # Remove lines of channels no longer present
+        removed = [ch for ch in self.waveform_lines if ch not in waveform_data]
+        for channel in removed:
+            self.waveform_lines.pop(channel).remove()
             
+        # Reuse existing lines; only new channels create one
+        added = False
+        for channel, (time_data, voltage_data) in waveform_data.items():
+            line = self.waveform_lines.get(channel)
+            if line is None:
+                color = self.channel_colors.get(channel, 'white')
+                line, = self.ax.plot(time_data, voltage_data, 
+                                   color=color, 
+                                   label=f'CH{channel}',
+                                   linewidth=1.5)
+                self.waveform_lines[channel] = line
+                added = True
+            else:
+                line.set_data(time_data, voltage_data)
+                
         # Update axes
         if waveform_data:
             self.ax.relim()
             self.ax.autoscale()
-            self.ax.legend()
-            
-        self.canvas.draw()
+            if added or removed:
+                self.ax.legend()
+                
+        # Repaint once control returns to the event loop
+        self.canvas.draw_idle()
         
     def clear_display(self):
         """Clear waveform display"""
@@ -82,4 +90,5 @@ class WaveformWidget(QWidget):
         self.ax.set_ylabel('Voltage (V)')
         self.ax.set_title('Oscilloscope Waveforms')
         self.ax.grid(True, alpha=0.3)
-        self.canvas.draw()
+        self.waveform_lines.clear()  # ax.clear() removed them
+        self.canvas.draw_idle()
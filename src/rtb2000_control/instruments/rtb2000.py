@@ -6,10 +6,24 @@ from ..communication.visa_instrument import VisaInstrument
 from typing import Dict, List, Tuple, Optional
 import numpy as np
 
+from ..analysis._kernels import affine_ramp, affine_scale
+
 
 class RTB2000(VisaInstrument):
     """R&S RTB2000 series oscilloscope control class"""
     
+    # Measurement name -> SCPI measurement keyword
+    MEASUREMENT_COMMANDS = {
+        'frequency': 'FREQ',
+        'amplitude': 'APP',
+        'mean': 'MEAN',
+        'rms': 'RMS'
+    }
+    
+    # Frames served from a cached preamble before it is read again, to pick
+    # up front-panel changes that keep the record length
+    PREAMBLE_REFRESH_FRAMES = 50
+    
     def __init__(self, resource_name: Optional[str] = None):
         """
         Initialize RTB2000 oscilloscope
@@ -20,13 +34,30 @@ class RTB2000(VisaInstrument):
         super().__init__(resource_name)
         self.channels = [1, 2, 3, 4]  # RTB2000 has 4 channels
         
+        # Per channel: ((x_increment, x_origin, y_increment, y_origin),
+        # point count, frames served). Cleared by every setter that can
+        # change it; _fetch_waveform rereads it on a point count change.
+        self._preamble_cache: Dict[int, Tuple[Tuple[float, float, float, float], int, int]] = {}
+        
+    def connect(self, resource_name: Optional[str] = None) -> bool:
+        """Connect to the instrument, discarding any cached preamble"""
+        self._preamble_cache.clear()
+        return super().connect(resource_name)
+        
+    def _write_scaling(self, command: str):
+        """Write a setting that changes waveform scaling and drop the preamble cache"""
+        # Under io_lock so a concurrent fetch cannot cache the old preamble
+        with self.io_lock:
+            self.write(command)
+            self._preamble_cache.clear()
+            
     def identify(self) -> str:
         """Get instrument identification"""
         return self.query("*IDN?")
     
     def reset(self):
         """Reset instrument to default state"""
-        self.write("*RST")
+        self._write_scaling("*RST")
         self.write("*OPC?")  # Wait for operation complete
     
     # Channel Control
@@ -42,7 +73,7 @@ class RTB2000(VisaInstrument):
     
     def set_vertical_scale(self, channel: int, scale: float):
         """Set vertical scale (volts/div)"""
-        self.write(f"CHAN{channel}:SCAL {scale}")
+        self._write_scaling(f"CHAN{channel}:SCAL {scale}")
     
     def get_vertical_scale(self, channel: int) -> float:
         """Get vertical scale"""
@@ -50,7 +81,7 @@ class RTB2000(VisaInstrument):
     
     def set_vertical_position(self, channel: int, position: float):
         """Set vertical position (divisions)"""
-        self.write(f"CHAN{channel}:POS {position}")
+        self._write_scaling(f"CHAN{channel}:POS {position}")
     
     def get_vertical_position(self, channel: int) -> float:
         """Get vertical position"""
@@ -58,7 +89,7 @@ class RTB2000(VisaInstrument):
     
     def set_coupling(self, channel: int, coupling: str):
         """Set input coupling (DC, AC, GND)"""
-        self.write(f"CHAN{channel}:COUP {coupling}")
+        self._write_scaling(f"CHAN{channel}:COUP {coupling}")
     
     def get_coupling(self, channel: int) -> str:
         """Get input coupling"""
@@ -67,7 +98,7 @@ class RTB2000(VisaInstrument):
     # Timebase Control
     def set_timebase_scale(self, scale: float):
         """Set horizontal timebase scale (seconds/div)"""
-        self.write(f"TIM:SCAL {scale}")
+        self._write_scaling(f"TIM:SCAL {scale}")
     
     def get_timebase_scale(self) -> float:
         """Get timebase scale"""
@@ -75,7 +106,7 @@ class RTB2000(VisaInstrument):
     
     def set_timebase_position(self, position: float):
         """Set horizontal position (seconds)"""
-        self.write(f"TIM:POS {position}")
+        self._write_scaling(f"TIM:POS {position}")
     
     def get_timebase_position(self) -> float:
         """Get horizontal position"""
@@ -109,54 +140,138 @@ class RTB2000(VisaInstrument):
     # Acquisition Control
     def single_trigger(self):
         """Perform single trigger acquisition"""
-        self.write("SING")
+        self._write_scaling("SING")
     
     def run_continuous(self):
         """Start continuous acquisition"""
-        self.write("RUN")
+        self._write_scaling("RUN")
     
     def stop_acquisition(self):
         """Stop acquisition"""
-        self.write("STOP")
+        self._write_scaling("STOP")
     
     def get_acquisition_state(self) -> str:
         """Get acquisition state"""
         return self.query("ACQ:STAT?")
     
+    def set_record_length(self, points: int):
+        """Set acquisition record length in points"""
+        self._write_scaling(f"ACQ:POIN {points}")
+    
+    def get_record_length(self) -> int:
+        """Get acquisition record length in points"""
+        return int(float(self.query("ACQ:POIN?")))
+    
+    def set_acquisition_type(self, acq_type: str):
+        """Set acquisition type (REFR, AVER, ENV)"""
+        self._write_scaling(f"ACQ:TYPE {acq_type}")
+    
+    def get_acquisition_type(self) -> str:
+        """Get acquisition type"""
+        return self.query("ACQ:TYPE?")
+    
     # Data Acquisition
-    def get_waveform_data(self, channel: int) -> Tuple[np.ndarray, np.ndarray]:
+    def get_waveform_data(self, channel: int,
+                          out_time: Optional[np.ndarray] = None,
+                          out_voltage: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Get waveform data from specified channel
         
         Args:
             channel: Channel number (1-4)
+            out_time: Optional buffer for the time axis, reused if large enough
+            out_voltage: Optional buffer for the voltage data, reused if large enough
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (time_data, voltage_data), views
+            into the supplied buffers or into newly allocated ones
+        """
+        # Hold the I/O lock so format, source selection and transfer stay paired
+        with self.io_lock:
+            self._set_waveform_format()
+            return self._fetch_waveform(channel, out_time, out_voltage)
+            
+    def acquire_frame(self, channels: List[int],
+                      buffers: Optional[Dict[int, Tuple[np.ndarray, np.ndarray]]] = None
+                      ) -> Tuple[Dict[int, Tuple[np.ndarray, np.ndarray]], np.ndarray]:
+        """
+        Get waveforms and measurements for several channels in one transaction
+        
+        The data format is set once per frame rather than once per channel,
+        and all measurements are read with a single compound query.
+        
+        Args:
+            channels: Channel numbers (1-4)
+            buffers: Optional {channel: (out_time, out_voltage)} buffers to reuse
             
         Returns:
-            Tuple[np.ndarray, np.ndarray]: (time_data, voltage_data)
+            Tuple of {channel: (time_data, voltage_data)} and the measurement
+            values from measure_batch_values, one row per channel
         """
-        # Set data format
-        self.write("FORM:DATA REAL")
-        self.write("FORM:BORD LSB")
+        if buffers is None:
+            buffers = {}
+            
+        waveform_data = {}
+        with self.io_lock:
+            if channels:
+                self._set_waveform_format()
+            for channel in channels:
+                out_time, out_voltage = buffers.get(channel, (None, None))
+                waveform_data[channel] = self._fetch_waveform(channel, out_time, out_voltage)
+                
+            measurements = self.measure_batch_values(channels)
+            
+        return waveform_data, measurements
         
-        # Select channel for data transfer
-        self.write(f"DAT:SOUR CHAN{channel}")
+    def _set_waveform_format(self):
+        """Select 16-bit little-endian integer waveform transfers"""
+        # 16 bits cover the 10-bit ADC at half the wire bytes of REAL;
+        # samples are scaled to volts on the host from the preamble
+        self.write("FORM:DATA INT,16;:FORM:BORD LSB")
         
-        # Get waveform preamble for scaling
-        preamble = self.query("DAT:PRE?").split(',')
-        y_increment = float(preamble[7])
-        y_origin = float(preamble[8])
-        y_reference = float(preamble[9])
-        x_increment = float(preamble[4])
-        x_origin = float(preamble[5])
+    @staticmethod
+    def _parse_preamble(preamble: str) -> Tuple[float, float, float, float]:
+        """Extract (x_increment, x_origin, y_increment, y_origin) from DAT:PRE?"""
+        fields = preamble.split(',')
+        return (float(fields[4]), float(fields[5]),
+                float(fields[7]), float(fields[8]))
+        
+    def _fetch_waveform(self, channel: int,
+                        out_time: Optional[np.ndarray],
+                        out_voltage: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Transfer and scale one channel; the caller holds io_lock"""
+        cached = self._preamble_cache.get(channel)
+        if cached is None:
+            # Select the channel and read its preamble for scaling in one
+            # compound message, saving a round trip per channel
+            scaling = self._parse_preamble(self.query(f"DAT:SOUR CHAN{channel};:DAT:PRE?"))
+            points, frames = None, 0
+        else:
+            self.write(f"DAT:SOUR CHAN{channel}")
+            scaling, points, frames = cached
+            
+        # Get raw ADC codes, decoded straight from the binary block
+        raw_data = self.query_binary_values("DAT:WAV?", datatype='h', container=np.ndarray)
         
-        # Get raw waveform data
-        raw_data = self.query_binary_values("DAT:WAV?", datatype='f')
+        n = raw_data.size
+        if points is not None and (n != points or frames >= self.PREAMBLE_REFRESH_FRAMES):
+            # Record length or acquisition changes made on the front panel
+            # bypass _write_scaling; reread the preamble of this transfer
+            scaling = self._parse_preamble(self.query("DAT:PRE?"))
+            frames = 0
+        self._preamble_cache[channel] = (scaling, n, frames + 1)
+        x_increment, x_origin, y_increment, y_origin = scaling
         
-        # Convert to voltage
-        voltage_data = np.array(raw_data) * y_increment + y_origin
+        if out_voltage is None or len(out_voltage) < n:
+            out_voltage = np.empty(n)
+        if out_time is None or len(out_time) < n:
+            out_time = np.empty(n)
+        voltage_data = out_voltage[:n]
+        time_data = out_time[:n]
         
-        # Generate time axis
-        time_data = np.arange(len(voltage_data)) * x_increment + x_origin
+        # Convert to voltage and generate the time axis in place
+        affine_scale(raw_data, y_increment, y_origin, voltage_data)
+        affine_ramp(x_increment, x_origin, time_data)
         
         return time_data, voltage_data
     
@@ -177,6 +292,57 @@ class RTB2000(VisaInstrument):
         """Measure RMS value"""
         return float(self.query(f"MEAS:RMS? CHAN{channel}"))
     
+    def measure_batch_values(self, channels: List[int],
+                             metrics: Optional[List[str]] = None) -> np.ndarray:
+        """
+        Measure several values on several channels with a single query
+        
+        Args:
+            channels: Channel numbers (1-4)
+            metrics: Measurement names from MEASUREMENT_COMMANDS (default: all)
+            
+        Returns:
+            np.ndarray: Values with shape (len(channels), len(metrics))
+        """
+        if metrics is None:
+            metrics = list(self.MEASUREMENT_COMMANDS)
+            
+        if not channels:
+            return np.empty((0, len(metrics)))
+            
+        # One compound SCPI command instead of a round-trip per value
+        queries = [
+            f"MEAS:{self.MEASUREMENT_COMMANDS[metric]}? CHAN{channel}"
+            for channel in channels
+            for metric in metrics
+        ]
+        response = self.query(";:".join(queries))
+        
+        values = np.array(response.split(';'), dtype=np.float64)
+        return values.reshape(len(channels), len(metrics))
+    
+    def measure_batch(self, channels: List[int],
+                      metrics: Optional[List[str]] = None) -> Dict[int, Dict[str, float]]:
+        """
+        Measure several values on several channels with a single query
+        
+        Args:
+            channels: Channel numbers (1-4)
+            metrics: Measurement names from MEASUREMENT_COMMANDS (default: all)
+            
+        Returns:
+            Dict[int, Dict[str, float]]: Measurements keyed by channel, then name
+        """
+        if metrics is None:
+            metrics = list(self.MEASUREMENT_COMMANDS)
+            
+        values = self.measure_batch_values(channels, metrics)
+        
+        return {
+            channel: dict(zip(metrics, row.tolist()))
+            for channel, row in zip(channels, values)
+        }
+    
     # Utility Functions
     def screenshot(self, filename: str = "screenshot.png"):
         """Take screenshot and save to file"""